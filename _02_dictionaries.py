@@ -12,6 +12,8 @@
 # - dict_perf.py: 0.687 seconds
 # - dict_perf is 82.83% faster than list_perf
 # - 5.82x speedup
+# - Timed as cProfile.run("main()"); python bench.py list_perf dict_perf
+#   times main() without the profiler, so expect lower figures
 
 # ---------- Merging dictionaries ----------
 from collections import defaultdict
@@ -45,13 +47,16 @@ print(team)
 team = {**line_one, **line_two}
 print(team)
 
+# Every style above copies every entry; see merged_view.py to read a few keys
+# from large merges without copying (python merge_perf.py)
+
 # ---------- Hacking Python's memory with slots ----------
-# - See slots_perf.py
+# - See slots_perf.py (python bench.py slots_perf)
 # - Using slots saved 91.6 MiB memory vs not using slots
 # - That's 2.49x memory savings
 # - Using slots saved 7.6 MiB memory vs using tuples
 # - Using slots doesn't save memory vs dataclasses (+7.6 MiB memory)
-# - Slots can speedup attribute access as well
+# - Slots can speedup attribute access as well (see slots_perf.py)
 # - Do not use slots by default! (maintenance suffers)
 # - https://tech.oyster.com/save-ram-with-python-slots/
 
@@ -138,6 +143,9 @@ meaning = switch_on_light_colour.get(
 )
 meaning()
 
+# See enum_dispatch.py for a value-indexed table with coverage checks and
+# batch dispatch (python dispatch_perf.py)
+
 # ---------- To and from JSON ----------
 
 movie_json = """
@@ -150,6 +158,7 @@ movie_json = """
 """
 
 # Use the 'json' module
+# (see json_stream.py for arrays too large to load whole, python json_perf.py)
 
 # json to dict
 movie_data = json.loads(movie_json)
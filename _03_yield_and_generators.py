@@ -24,6 +24,9 @@ def generator_fibonacci():
         yield current
 
 
+# Both walk the sequence from the start, the nth term costs O(n) additions
+# See fibonacci.py for the nth term (and ranges) in O(log n)
+
 if __name__ == "__main__":
     # Classic
     for m in classic_fibonacci(100):
@@ -89,8 +92,13 @@ for node in next_iter(nodes[0]):
     print(node.data, end=" -> ")
 print(end="\n")
 
+# next() is O(n**2) and fails at ~1000 nodes; see linked_list.py for a list
+# that scales to millions of nodes (python linked_list_perf.py)
+
 # ---------- Inline generators via generator expressions ----------
 
+# See measurement_pipeline.py to compute these from multi-GB CSV/JSONL feeds
+# in one pass (python pipeline_perf.py)
 Measurement = collections.namedtuple("Measurement", "id x y value")
 
 measurements = [
@@ -17,6 +17,8 @@ def find_special_numbers(special_selector, limit=10):
     return found
 
 
+# See special_numbers.py for large limits and selectors that take a whole
+# block of candidates at once (python special_perf.py)
 for n in find_special_numbers(is_odd, 50):
     print(n, end=", ")
 print(end="\n")
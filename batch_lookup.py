@@ -0,0 +1,102 @@
+"""Batched multi-id lookup
+
+- list_perf._locate_interesting_ids scans the whole list once per id:
+  O(ids x points)
+- dict_perf._locate_interesting_ids probes the dict once per id in a
+  Python loop and raises KeyError for unknown ids
+- lookup_many resolves a whole id collection in one call:
+  - lists: sort the requested ids and merge them against a sorted id
+    column, advancing through the column with bisect
+  - mappings and DataPointStores: probe all ids at once with map(get, ids)
+- Results keep the requested order; unknown ids are reported, not raised
+- See lookup_perf.py for numbers
+"""
+
+
+from array import array
+from bisect import bisect_left
+import collections
+from collections.abc import Mapping
+from typing import Iterable, Sequence
+
+from datapoint_store import DataPointStore
+
+BatchLookup = collections.namedtuple("BatchLookup", "found missing")
+BatchLookup.__doc__ = """Result of lookup_many.
+
+found: The records that were found, in the requested order.
+missing: The ids that were not found, in the requested order.
+"""
+
+
+class SortedIdColumn:
+    """The ids of a list of records, sorted, with each id's list position.
+
+    Build it once per list and reuse it for every lookup_many call. It must be
+    rebuilt if the list is reordered or modified.
+    """
+
+    __slots__ = ("ids", "positions")
+
+    def __init__(self, data_points: Sequence) -> None:
+        order = sorted(
+            range(len(data_points)), key=lambda p: data_points[p].id
+        )
+        self.ids = array("q", (data_points[p].id for p in order))
+        self.positions = array("q", order)
+
+    def resolve(self, ids: Sequence[int]) -> list[int | None]:
+        """Return the list position of each id, or None if it is unknown."""
+        sorted_ids = self.ids
+        positions = self.positions
+        size = len(sorted_ids)
+        resolved: list[int | None] = [None] * len(ids)
+
+        # Merge: visit the requested ids in sorted order so each search
+        # starts where the previous one stopped
+        low = 0
+        for i in sorted(range(len(ids)), key=ids.__getitem__):
+            d_id = ids[i]
+            low = bisect_left(sorted_ids, d_id, low)
+            if low == size:
+                break
+            if sorted_ids[low] == d_id:
+                resolved[i] = positions[low]
+        return resolved
+
+
+def _split(ids: Sequence[int], records: Iterable) -> BatchLookup:
+    found = []
+    missing = []
+    for d_id, record in zip(ids, records):
+        if record is None:
+            missing.append(d_id)
+        else:
+            found.append(record)
+    return BatchLookup(found, missing)
+
+
+def lookup_many(
+    data_points, ids: Iterable[int], id_column: SortedIdColumn | None = None
+) -> BatchLookup:
+    """Look up many ids at once.
+
+    :param data_points: A dict keyed by id, a DataPointStore or a list of
+        records with an 'id' attribute.
+    :param ids: The ids to find. Order is kept; sets give their own order.
+    :param id_column: For lists, a prebuilt SortedIdColumn. Built on the fly
+        if omitted, which costs a sort of the whole list.
+    :return: BatchLookup(found, missing).
+    """
+    ids = list(ids)
+
+    if isinstance(data_points, (Mapping, DataPointStore)):
+        return _split(ids, map(data_points.get, ids))
+
+    if id_column is None:
+        id_column = SortedIdColumn(data_points)
+    records = (
+        None if position is None else data_points[position]
+        for position in id_column.resolve(ids)
+    )
+    return _split(ids, records)
@@ -0,0 +1,290 @@
+"""Benchmark runner for the *_perf.py scenarios
+
+- Discovers the *_perf.py scripts next to this file that define bench()
+- Each timed repeat runs in a fresh interpreter: the optional bench_setup(),
+  then --warmup untimed bench() calls, then one timed bench() call; the
+  script's __main__ block (profiler, CLI) does not run
+- Reports median/p95 wall time per scenario, and peak RSS separately for
+  the setup and for the timed bench() call (where Linux allows resetting
+  the peak; elsewhere the bench() figure includes the setup)
+- Writes JSON results; --compare diffs them against a previous run
+
+Usage:
+    python bench.py                              # all scenarios
+    python bench.py dict_perf list_perf -r 10    # selected scenarios
+    python bench.py -o new.json --compare old.json
+"""
+
+
+import argparse
+import ast
+from datetime import datetime, timezone
+import importlib
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from memprofile import peak_rss_bytes, reset_peak_rss
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCENARIO_SUFFIX = "_perf"
+SCENARIO_ENTRY = "bench"
+SCENARIO_SETUP = "bench_setup"
+
+# Exit codes, so scripts (e.g. CI) can act on the result
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_REGRESSION = 2
+
+
+def _defines_entry(path: Path) -> bool:
+    # Parsed, not imported: importing runs the module's top-level code
+    tree = ast.parse(path.read_text(), str(path))
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            names = [node.name]
+        elif isinstance(node, ast.Assign):
+            names = [t.id for t in node.targets if isinstance(t, ast.Name)]
+        else:
+            continue
+        if SCENARIO_ENTRY in names:
+            return True
+    return False
+
+
+def discover_scenarios(directory: Path = BENCH_DIR) -> dict[str, Path]:
+    """Map scenario name (file stem) to path for each scenario script."""
+    return {
+        path.stem: path
+        for path in sorted(directory.glob(f"*{SCENARIO_SUFFIX}.py"))
+        if _defines_entry(path)
+    }
+
+
+def _run_child(path: str, warmup: int) -> None:
+    """Run one scenario in this (fresh) process and print a JSON result."""
+    result_stream = sys.stdout
+    sys.argv = [path]
+    sys.path.insert(0, str(Path(path).parent))
+    with open(os.devnull, "w") as devnull:
+        sys.stdout = devnull
+        try:
+            module = importlib.import_module(Path(path).stem)
+            setup = getattr(module, SCENARIO_SETUP, None)
+            if setup is not None:
+                setup()
+            setup_peak = peak_rss_bytes()
+            entry = getattr(module, SCENARIO_ENTRY)
+            for _ in range(warmup):
+                entry()
+            reset_peak_rss()
+            start = time.perf_counter()
+            entry()
+            wall = time.perf_counter() - start
+        finally:
+            sys.stdout = result_stream
+
+    json.dump(
+        {
+            "wall_s": wall,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "setup_peak_rss_bytes": setup_peak,
+        },
+        sys.stdout,
+    )
+
+
+def run_once(
+    path: Path, warmup: int = 0, timeout: float | None = None
+) -> dict:
+    """Run a scenario in an isolated subprocess and return its measurements.
+
+    :param path: The scenario script.
+    :param warmup: Untimed bench() calls before the timed one.
+    :param timeout: Seconds to wait before giving up, None to wait forever.
+    :return: A dict with 'wall_s', 'peak_rss_bytes' (timed call) and
+        'setup_peak_rss_bytes'.
+    :raises subprocess.CalledProcessError: If the scenario fails.
+    """
+    completed = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--child",
+            str(path),
+            "--warmup",
+            str(warmup),
+        ],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        check=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def _max_peak(samples: list[dict], key: str) -> int | None:
+    peaks = [s[key] for s in samples if s[key]]
+    return max(peaks) if peaks else None
+
+
+def summarize(samples: list[dict]) -> dict:
+    walls = [s["wall_s"] for s in samples]
+    if len(walls) > 1:
+        p95 = statistics.quantiles(walls, n=20, method="inclusive")[-1]
+    else:
+        p95 = walls[0]
+    return {
+        "runs": len(walls),
+        "wall_s": walls,
+        "median_s": statistics.median(walls),
+        "p95_s": p95,
+        "min_s": min(walls),
+        "max_s": max(walls),
+        "peak_rss_bytes": _max_peak(samples, "peak_rss_bytes"),
+        "setup_peak_rss_bytes": _max_peak(samples, "setup_peak_rss_bytes"),
+    }
+
+
+def run_scenario(
+    path: Path, warmup: int, repeat: int, timeout: float | None = None
+) -> dict:
+    return summarize([run_once(path, warmup, timeout) for _ in range(repeat)])
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """Print median changes per scenario and return the regressed names.
+
+    :param baseline: A previous bench.py JSON result.
+    :param current: The bench.py JSON result to check.
+    :param threshold: Relative slowdown (0.1 = 10%) counted as a regression.
+    :return: Names of scenarios whose median regressed past the threshold.
+    """
+    regressions = []
+    print(f"\n{'scenario':<16} {'base (s)':>10} {'new (s)':>10} {'change':>8}")
+    for name, result in current["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if base is None:
+            print(f"{name:<16} {'-':>10} {result['median_s']:>10.3f}")
+            continue
+        change = result["median_s"] / base["median_s"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<16} {base['median_s']:>10.3f} "
+            f"{result['median_s']:>10.3f} {change:>+8.1%}{flag}"
+        )
+    return regressions
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Run the *_perf.py scenarios as repeatable benchmarks."
+    )
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        help="scenario names to run (default: all discovered)",
+    )
+    parser.add_argument(
+        "-w",
+        "--warmup",
+        type=int,
+        default=1,
+        help="untimed bench() calls before each timed one",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument(
+        "-t", "--timeout", type=float, default=None, help="seconds per run"
+    )
+    parser.add_argument("-o", "--output", type=Path, help="write JSON here")
+    parser.add_argument(
+        "--compare", type=Path, help="baseline JSON to diff against"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="relative median slowdown reported as a regression",
+    )
+    parser.add_argument("--list", action="store_true", help="list scenarios")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+
+    if args.child:
+        _run_child(args.child, args.warmup)
+        return EXIT_OK
+
+    available = discover_scenarios()
+    if args.list:
+        print("\n".join(available))
+        return EXIT_OK
+
+    unknown = set(args.scenarios) - set(available)
+    if unknown:
+        print(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+        return EXIT_FAILED
+    selected = args.scenarios or list(available)
+
+    results = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "warmup": args.warmup,
+        "repeat": args.repeat,
+        "scenarios": {},
+    }
+
+    print(
+        f"{'scenario':<16} {'median (s)':>11} {'p95 (s)':>9} "
+        f"{'peak MiB':>9} {'setup MiB':>10}"
+    )
+    for name in selected:
+        try:
+            result = run_scenario(
+                available[name], args.warmup, args.repeat, args.timeout
+            )
+        except subprocess.CalledProcessError as e:
+            print(f"{name:<16} FAILED\n{e.stderr}")
+            return EXIT_FAILED
+        except subprocess.TimeoutExpired:
+            print(f"{name:<16} TIMEOUT")
+            return EXIT_FAILED
+
+        results["scenarios"][name] = result
+        peak_mib, setup_mib = (
+            f"{peak / 2**20:.1f}" if peak else "-"
+            for peak in (
+                result["peak_rss_bytes"],
+                result["setup_peak_rss_bytes"],
+            )
+        )
+        print(
+            f"{name:<16} {result['median_s']:>11.3f} "
+            f"{result['p95_s']:>9.3f} {peak_mib:>9} {setup_mib:>10}"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if compare(baseline, results, args.threshold):
+            return EXIT_REGRESSION
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""Throughput: struct codec vs json for shipping DataPoint records
+
+500k records, each direction timed separately:
+- encode: pack() / pack_store() vs json.dumps(data_points)
+- decode: unpack() vs json.loads(text)
+- scan:   sum(temp) with RecordCursor.column() and a moving cursor, vs
+          json.loads followed by iterating the namedtuples (_print_results
+          style consumers)
+"""
+
+
+import json
+import timeit
+
+from datapoint_codec import RecordCursor, pack, pack_store, unpack
+from datapoint_gen import make_data_points, make_store
+
+COUNT = 500_000
+
+
+def _cursor_scan(buffer):
+    return sum(record.temp for record in RecordCursor(buffer))
+
+
+def _column_scan(buffer):
+    return sum(RecordCursor(buffer).column("temp"))
+
+
+def _json_scan(text):
+    return sum(row[3] for row in json.loads(text))
+
+
+def _seconds(func):
+    return min(timeit.repeat(func, number=1, repeat=3))
+
+
+def main():
+    data_points = make_data_points(COUNT)
+    store = make_store(COUNT)
+    buffer = pack(data_points)
+    text = json.dumps(data_points)
+
+    print(
+        f"{COUNT:,} records: {len(buffer) / 2**20:.1f} MiB packed, "
+        f"{len(text) / 2**20:.1f} MiB json"
+    )
+    print(f"{'operation':<28} {'seconds':>8} {'records/s':>12}")
+    for name, func in (
+        ("encode: pack()", lambda: pack(data_points)),
+        ("encode: pack_store()", lambda: pack_store(store)),
+        ("encode: json.dumps", lambda: json.dumps(data_points)),
+        ("decode: unpack()", lambda: unpack(buffer)),
+        ("decode: json.loads", lambda: json.loads(text)),
+        ("scan: RecordCursor", lambda: _cursor_scan(buffer)),
+        ("scan: RecordCursor.column()", lambda: _column_scan(buffer)),
+        ("scan: json.loads + iterate", lambda: _json_scan(text)),
+    ):
+        seconds = _seconds(func)
+        print(f"{name:<28} {seconds:>8.3f} {COUNT / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
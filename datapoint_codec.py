@@ -0,0 +1,137 @@
+"""Binary codec for shipping DataPoint records between services
+
+Each record is packed as 24 little-endian bytes, with every field at its
+natural alignment:
+
+    offset  0  id       int64
+    offset  8  quality  float64
+    offset 16  x        int16
+    offset 18  y        int16
+    offset 20  temp     int8
+    offset 21  padding  3 bytes
+
+- pack()/pack_store() write whole batches into one contiguous bytearray
+- unpack() turns a batch back into DataPoint namedtuples
+- RecordCursor reads fields straight out of typed memoryview casts of the
+  buffer, so no tuple or row object is built per record
+- See codec_perf.py for throughput against json
+"""
+
+
+from itertools import starmap
+import struct
+import sys
+from typing import Iterable, Iterator
+
+from datapoint_store import DataPoint, DataPointStore
+
+RECORD = struct.Struct("<qdhhb3x")
+
+# Field -> (typecode, index of the field's first item, items per record)
+_FIELDS = {
+    "id": ("q", 0, RECORD.size // 8),
+    "quality": ("d", 1, RECORD.size // 8),
+    "x": ("h", 8, RECORD.size // 2),
+    "y": ("h", 9, RECORD.size // 2),
+    "temp": ("b", 20, RECORD.size),
+}
+
+# Fields are cast from the buffer in native byte order
+if sys.byteorder != "little":
+    raise ImportError("datapoint_codec requires a little-endian platform")
+
+
+def pack(data_points: Iterable[tuple]) -> bytearray:
+    """Pack DataPoints (or any (id, x, y, temp, quality) tuples)."""
+    return bytearray().join(
+        RECORD.pack(d_id, quality, x, y, temp)
+        for d_id, x, y, temp, quality in data_points
+    )
+
+
+def pack_store(store: DataPointStore) -> bytearray:
+    """Pack every record of a DataPointStore, straight from its columns."""
+    columns = (store.column(name) for name in ("id", "quality", "x", "y"))
+    return bytearray().join(
+        starmap(RECORD.pack, zip(*columns, store.column("temp")))
+    )
+
+
+def unpack(buffer) -> list[DataPoint]:
+    """Unpack a whole batch into DataPoint namedtuples."""
+    return [
+        DataPoint(d_id, x, y, temp, quality)
+        for d_id, quality, x, y, temp in RECORD.iter_unpack(buffer)
+    ]
+
+
+class RecordCursor:
+    """Field access into a packed batch without unpacking it.
+
+    The cursor points at one record at a time; iterating moves the same
+    cursor forward instead of creating an object per record:
+
+        for record in RecordCursor(buffer):
+            total += record.temp
+
+    column(name) returns a zero-copy, strided view of one field.
+    The buffer must not be resized while a cursor is using it.
+    """
+
+    __slots__ = ("_views", "_count", "position")
+
+    def __init__(self, buffer) -> None:
+        data = memoryview(buffer).cast("B")
+        if len(data) % RECORD.size:
+            raise ValueError(
+                f"Buffer size {len(data)} is not a multiple of {RECORD.size}"
+            )
+        self._views = {
+            typecode: data.cast(typecode) for typecode in ("q", "d", "h", "b")
+        }
+        self._count = len(data) // RECORD.size
+        self.position = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def seek(self, position: int) -> "RecordCursor":
+        if not 0 <= position < self._count:
+            raise IndexError(position)
+        self.position = position
+        return self
+
+    def __iter__(self) -> Iterator["RecordCursor"]:
+        for position in range(self._count):
+            self.position = position
+            yield self
+
+    def column(self, name: str) -> memoryview:
+        """Return a strided view of one field across all records."""
+        typecode, first, stride = _FIELDS[name]
+        return self._views[typecode][first::stride]
+
+    def to_data_point(self) -> DataPoint:
+        """Materialize the current record as a DataPoint namedtuple."""
+        return DataPoint._make(
+            getattr(self, name) for name in DataPoint._fields
+        )
+
+    def release(self) -> None:
+        """Release the views so the underlying buffer can be resized."""
+        for view in self._views.values():
+            view.release()
+
+
+def _field_property(name: str) -> property:
+    typecode, first, stride = _FIELDS[name]
+
+    def getter(cursor: RecordCursor):
+        return cursor._views[typecode][first + cursor.position * stride]
+
+    return property(getter, doc=f"The '{name}' field of the current record.")
+
+
+for _name in DataPoint._fields:
+    setattr(RecordCursor, _name, _field_property(_name))
+del _name
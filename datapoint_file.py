@@ -0,0 +1,230 @@
+"""Memory-mapped on-disk format for DataPoint records
+
+File layout (little-endian, every section 8-byte aligned):
+
+    header      magic b"DPTS", version u16, section count u16, row count u64
+    directory   one entry per section: name 8s, typecode 1s, pad 7x, offset u64
+    sections    one fixed-width column per DataPoint field, in field order,
+                then 'sid'/'spos' (sorted ids and their positions) when the
+                ids are not dense (id != position)
+
+- DataPointFile maps the file and casts each column straight out of the
+  mapping, nothing is read or copied up front
+- Lookups and scans only touch the pages they need
+- Rows are the same DataPointRow views DataPointStore hands out
+- See file_perf.py for open times against regenerating and unpickling
+"""
+
+
+from array import array
+from bisect import bisect_left
+import mmap
+import struct
+import sys
+from typing import Iterator
+
+from datapoint_store import (
+    COLUMN_TYPECODES,
+    DataPoint,
+    DataPointRow,
+    DataPointStore,
+)
+
+MAGIC = b"DPTS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQ")
+DIRECTORY_ENTRY = struct.Struct("<8ss7xQ")
+ALIGNMENT = 8
+# Typecodes of the sorted id index, present when ids are not dense
+INDEX_TYPECODES = {"sid": "q", "spos": "q"}
+
+# Columns are cast from the mapping in native byte order
+if sys.byteorder != "little":
+    raise ImportError("datapoint_file requires a little-endian platform")
+
+
+class DataPointFileError(ValueError):
+    """The file is not a valid DataPoint file."""
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def write_store(path, store: DataPointStore) -> None:
+    """Write every record of a DataPointStore to path.
+
+    :param path: The file to create or overwrite.
+    :param store: The records to write.
+    """
+    sections = [(name, store.column(name)) for name in DataPoint._fields]
+    ids = store.column("id")
+    if not store.is_dense:
+        order = sorted(range(len(ids)), key=ids.__getitem__)
+        sections.append(("sid", array("q", map(ids.__getitem__, order))))
+        sections.append(("spos", array("q", order)))
+
+    offset = _aligned(HEADER.size + DIRECTORY_ENTRY.size * len(sections))
+    directory = []
+    for name, values in sections:
+        directory.append((name, values.typecode, offset))
+        offset = _aligned(offset + values.itemsize * len(values))
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(sections), len(ids)))
+        for name, typecode, offset in directory:
+            f.write(
+                DIRECTORY_ENTRY.pack(
+                    name.encode("ascii"), typecode.encode("ascii"), offset
+                )
+            )
+        for (_, values), (_, _, offset) in zip(sections, directory):
+            f.write(b"\0" * (offset - f.tell()))
+            values.tofile(f)
+
+
+def write_data_points(path, data_points) -> None:
+    """Write an iterable of DataPoint tuples to path."""
+    write_store(path, DataPointStore(data_points))
+
+
+class DataPointFile:
+    """Read-only, memory-mapped access to a DataPoint file.
+
+    Supports the read side of DataPointStore: len(), iteration, lookup by id,
+    row(), column() and get(). Use it as a context manager, or call close();
+    rows and columns must not be used after the file is closed.
+    """
+
+    def __init__(self, path) -> None:
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty file
+                raise DataPointFileError(f"Empty file: {path}") from None
+        self._buffer = memoryview(self._mmap)
+
+        try:
+            magic, version, section_count, count = HEADER.unpack_from(
+                self._buffer
+            )
+        except struct.error as e:
+            self.close()
+            raise DataPointFileError(f"Truncated header: {e}") from None
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise DataPointFileError(
+                f"Not a DataPoint v{VERSION} file: {path}"
+            )
+
+        directory_end = HEADER.size + section_count * DIRECTORY_ENTRY.size
+        if directory_end > len(self._buffer):
+            self.close()
+            raise DataPointFileError(f"Truncated directory: {path}")
+
+        self._views: dict[str, memoryview] = {}
+        for n in range(section_count):
+            raw_name, raw_typecode, offset = DIRECTORY_ENTRY.unpack_from(
+                self._buffer, HEADER.size + n * DIRECTORY_ENTRY.size
+            )
+            try:
+                name = raw_name.rstrip(b"\0").decode("ascii")
+                typecode = raw_typecode.decode("ascii")
+                itemsize = array(typecode).itemsize
+            except ValueError:  # Also UnicodeDecodeError
+                self.close()
+                raise DataPointFileError(
+                    f"Invalid directory entry {n}"
+                ) from None
+            end = offset + itemsize * count
+            if end > len(self._buffer):
+                self.close()
+                raise DataPointFileError(f"Section {name!r} is truncated")
+            self._views[name] = self._buffer[offset:end].cast(typecode)
+
+        for name in DataPoint._fields:
+            view = self._views.get(name)
+            if view is None or view.format != COLUMN_TYPECODES[name]:
+                self.close()
+                raise DataPointFileError(f"Invalid column {name!r}")
+        if self._views.keys() & INDEX_TYPECODES.keys():
+            for name, typecode in INDEX_TYPECODES.items():
+                view = self._views.get(name)
+                if view is None or view.format != typecode:
+                    self.close()
+                    raise DataPointFileError(f"Invalid id index {name!r}")
+
+        # Read by DataPointRow, in DataPoint field order
+        self._columns = tuple(self._views[name] for name in DataPoint._fields)
+        self._sorted_ids = self._views.get("sid")
+        self._sorted_positions = self._views.get("spos")
+        self._count = count
+
+    def close(self) -> None:
+        # Exported buffers must be released before the mapping can close
+        for view in getattr(self, "_views", {}).values():
+            view.release()
+        self._columns = ()
+        self._buffer.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "DataPointFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def is_dense(self) -> bool:
+        return self._sorted_ids is None
+
+    def position_of(self, d_id: int) -> int:
+        """Return the position of the record with the given id.
+
+        :raises KeyError: If no record has that id.
+        """
+        if self.is_dense:
+            if 0 <= d_id < self._count:
+                return d_id
+            raise KeyError(d_id)
+
+        index = bisect_left(self._sorted_ids, d_id)  # type: ignore
+        if index < self._count and self._sorted_ids[index] == d_id:
+            return self._sorted_positions[index]  # type: ignore
+        raise KeyError(d_id)
+
+    def row(self, position: int) -> DataPointRow:
+        if not 0 <= position < self._count:
+            raise IndexError(position)
+        return DataPointRow(self, position)  # type: ignore
+
+    def column(self, name: str) -> memoryview:
+        """Return a zero-copy view of a column."""
+        return self._columns[DataPoint._fields.index(name)]
+
+    def get(self, d_id: int, default=None):
+        try:
+            return self[d_id]
+        except KeyError:
+            return default
+
+    def __getitem__(self, d_id: int) -> DataPointRow:
+        return DataPointRow(self, self.position_of(d_id))  # type: ignore
+
+    def __contains__(self, d_id: object) -> bool:
+        try:
+            self.position_of(d_id)  # type: ignore
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[DataPointRow]:
+        for position in range(self._count):
+            yield DataPointRow(self, position)  # type: ignore
+
+    def to_store(self) -> DataPointStore:
+        """Copy every record into an in-memory DataPointStore."""
+        return DataPointStore.from_columns(*self._columns)
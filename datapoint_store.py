@@ -0,0 +1,265 @@
+"""Columnar DataPoint storage
+
+- A dict of namedtuples boxes every field of every record as a Python object
+- DataPointStore keeps each field in one typed, contiguous 'array' instead
+- Rows are handed out as lightweight views that read straight from the columns
+- Id lookup matches the dict used by dict_perf._locate_interesting_ids
+- See store_perf.py for memory and lookup-latency numbers
+"""
+
+
+from array import array
+from bisect import bisect_left
+import collections
+from typing import Iterable, Iterator
+
+DataPoint = collections.namedtuple("DataPoint", "id x y temp quality")
+
+# Typecodes per column, sized for the dict_perf ranges:
+# id: 64-bit, x/y: 0..1000, temp: -10..50, quality: 0.0..1.0
+# Values outside a column's range raise OverflowError on insert
+COLUMN_TYPECODES: dict[str, str] = {
+    "id": "q",
+    "x": "h",
+    "y": "h",
+    "temp": "b",
+    "quality": "d",
+}
+
+
+class DataPointRow:
+    """A read-only view of a single row in a DataPointStore.
+
+    No field values are copied; each attribute reads from the store's columns.
+    """
+
+    __slots__ = ("_store", "_position")
+
+    def __init__(self, store: "DataPointStore", position: int) -> None:
+        self._store = store
+        self._position = position
+
+    @property
+    def position(self) -> int:
+        return self._position
+
+    def __iter__(self) -> Iterator:
+        position = self._position
+        for column in self._store._columns:
+            yield column[position]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (DataPointRow, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={value!r}" for name, value in zip(DataPoint._fields, self)
+        )
+        return f"DataPointRow({fields})"
+
+    def to_data_point(self) -> DataPoint:
+        """Materialize the row as a DataPoint namedtuple."""
+        return DataPoint._make(self)
+
+
+def _column_property(index: int, name: str) -> property:
+    def getter(row: DataPointRow):
+        return row._store._columns[index][row._position]
+
+    return property(getter, doc=f"The '{name}' field of this row.")
+
+
+for _index, _name in enumerate(DataPoint._fields):
+    setattr(DataPointRow, _name, _column_property(_index, _name))
+del _index, _name
+
+
+class DataPointStore:
+    """DataPoint records stored column by column in typed arrays.
+
+    Lookup by id is O(1) while ids are dense and in insertion order
+    (0, 1, 2, ...), which is how dict_perf generates them. Otherwise a sorted
+    id column is kept alongside the data and searched with bisect.
+    """
+
+    __slots__ = ("_columns", "_sorted_ids", "_sorted_positions", "_indexes")
+
+    def __init__(self, data_points: Iterable[tuple] = ()) -> None:
+        self._columns: tuple[array, ...] = tuple(
+            array(COLUMN_TYPECODES[name]) for name in DataPoint._fields
+        )
+        # None while ids == positions (dense); see _build_id_index
+        self._sorted_ids: array | None = None
+        self._sorted_positions: array | None = None
+        # Indexes notified by append(), see track()
+        self._indexes: list = []
+        self.extend(data_points)
+
+    @classmethod
+    def from_columns(cls, ids, xs, ys, temps, qualities) -> "DataPointStore":
+        """Build a store from one iterable per field.
+
+        :param ids: Record ids, must be unique.
+        :param xs: x coordinates.
+        :param ys: y coordinates.
+        :param temps: Temperatures.
+        :param qualities: Quality values.
+        :return: A new DataPointStore.
+        :raises ValueError: If the columns differ in length or ids repeat.
+        :raises OverflowError: If a value is out of its column's range.
+        """
+        store = cls()
+        for column, values in zip(
+            store._columns, (ids, xs, ys, temps, qualities)
+        ):
+            column.extend(values)
+
+        lengths = {len(column) for column in store._columns}
+        if len(lengths) != 1:
+            raise ValueError("All columns must have the same length")
+
+        ids_column = store._columns[0]
+        if any(d_id != position for position, d_id in enumerate(ids_column)):
+            store._build_id_index()
+        return store
+
+    def _build_id_index(self) -> None:
+        ids_column = self._columns[0]
+        order = sorted(range(len(ids_column)), key=ids_column.__getitem__)
+        sorted_ids = array("q", (ids_column[p] for p in order))
+        for previous, current in zip(sorted_ids, sorted_ids[1:]):
+            if previous == current:
+                raise ValueError(f"Duplicate id: {current}")
+        self._sorted_ids = sorted_ids
+        self._sorted_positions = array("q", order)
+
+    @property
+    def is_dense(self) -> bool:
+        """True while every record's id equals its position."""
+        return self._sorted_ids is None
+
+    def append(self, data_point: tuple) -> int:
+        """Add a record and return its position.
+
+        :param data_point: A DataPoint or any (id, x, y, temp, quality) tuple.
+        :return: The position of the new row.
+        :raises ValueError: If the id is taken or a field is missing.
+        :raises OverflowError: If a value is out of its column's range; the
+            store is left unchanged.
+        """
+        d_id = data_point[0]
+        position = len(self)
+        columns = self._columns
+
+        # Nothing is changed until the whole row is known to fit
+        if self.is_dense:
+            if d_id != position and 0 <= d_id < position:
+                raise ValueError(f"Duplicate id: {d_id}")
+        else:
+            index = bisect_left(self._sorted_ids, d_id)  # type: ignore
+            if (
+                index < len(self._sorted_ids)  # type: ignore
+                and self._sorted_ids[index] == d_id  # type: ignore
+            ):
+                raise ValueError(f"Duplicate id: {d_id}")
+
+        # A value out of its column's range raises OverflowError part way
+        # through the row: take the columns that did grow back
+        try:
+            for column, value in zip(columns, data_point):
+                column.append(value)
+            if len(columns[-1]) == position:
+                raise ValueError(
+                    f"Expected {len(columns)} fields, got {len(data_point)}"
+                )
+        except Exception:
+            for column in columns:
+                del column[position:]
+            raise
+
+        if self.is_dense:
+            if d_id != position:
+                self._build_id_index()
+        else:
+            self._sorted_ids.insert(index, d_id)  # type: ignore
+            self._sorted_positions.insert(index, position)  # type: ignore
+
+        for tracked in self._indexes:
+            tracked.add(data_point)
+        return position
+
+    def extend(self, data_points: Iterable[tuple]) -> None:
+        for data_point in data_points:
+            self.append(data_point)
+
+    def track(self, index) -> None:
+        """Keep an index up to date as records are appended.
+
+        The index must already cover the existing records; from then on its
+        add(data_point) method is called for every appended record.
+        """
+        self._indexes.append(index)
+
+    def position_of(self, d_id: int) -> int:
+        """Return the position of the record with the given id.
+
+        :raises KeyError: If no record has that id.
+        """
+        if self.is_dense:
+            if 0 <= d_id < len(self):
+                return d_id
+            raise KeyError(d_id)
+
+        index = bisect_left(self._sorted_ids, d_id)  # type: ignore
+        if (
+            index < len(self._sorted_ids)  # type: ignore
+            and self._sorted_ids[index] == d_id  # type: ignore
+        ):
+            return self._sorted_positions[index]  # type: ignore
+        raise KeyError(d_id)
+
+    def row(self, position: int) -> DataPointRow:
+        """Return a view of the row at the given position."""
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+        return DataPointRow(self, position)
+
+    def column(self, name: str) -> array:
+        """Return the backing array of a column. Do not modify it."""
+        return self._columns[DataPoint._fields.index(name)]
+
+    def get(self, d_id: int, default=None):
+        try:
+            return self[d_id]
+        except KeyError:
+            return default
+
+    def __getitem__(self, d_id: int) -> DataPointRow:
+        return DataPointRow(self, self.position_of(d_id))
+
+    def __contains__(self, d_id: object) -> bool:
+        try:
+            self.position_of(d_id)  # type: ignore
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def __iter__(self) -> Iterator[DataPointRow]:
+        for position in range(len(self)):
+            yield DataPointRow(self, position)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns and the id index (if any)."""
+        arrays = list(self._columns)
+        if not self.is_dense:
+            arrays += [self._sorted_ids, self._sorted_positions]
+        return sum(a.itemsize * len(a) for a in arrays)  # type: ignore
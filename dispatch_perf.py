@@ -0,0 +1,155 @@
+"""Enum dispatch: if/elif chain vs dict.get vs EnumDispatch
+
+Handlers return a string instead of printing. Events are drawn at random
+from all members, so every branch of the chain is taken.
+
+Moves is copied from _01_foundations.py, which calls sys.exit() at import.
+
+Usage: python dispatch_perf.py [events]
+"""
+
+
+from enum import Enum
+import random
+import sys
+import time
+
+from enum_dispatch import EnumDispatch
+from quiet_import import import_quietly
+
+TrafficLight = import_quietly("_02_dictionaries").TrafficLight
+
+EVENTS = 1_000_000
+
+
+class Moves(Enum):
+    West = 1
+    North = 2
+    East = 3
+    South = 4
+
+
+def stop():
+    return "stop"
+
+
+def go():
+    return "go"
+
+
+def caution():
+    return "proceed with caution"
+
+
+def four_way_stop():
+    return "No signal, treat as 4-way stop."
+
+
+def light_if_chain(light_colour):
+    if light_colour is TrafficLight.RED:
+        return stop()
+    elif light_colour is TrafficLight.GREEN:
+        return go()
+    elif light_colour is TrafficLight.YELLOW:
+        return caution()
+    else:
+        return four_way_stop()
+
+
+switch_on_light_colour = {
+    TrafficLight.RED: stop,
+    TrafficLight.GREEN: go,
+    TrafficLight.YELLOW: caution,
+}
+
+
+def light_dict(light_colour):
+    return switch_on_light_colour.get(light_colour, four_way_stop)()
+
+
+light_router = EnumDispatch(
+    TrafficLight, switch_on_light_colour, default=four_way_stop
+)
+
+
+def move_west():
+    return -1, 0
+
+
+def move_north():
+    return 0, 1
+
+
+def move_east():
+    return 1, 0
+
+
+def move_south():
+    return 0, -1
+
+
+def move_if_chain(move):
+    if move is Moves.West:
+        return move_west()
+    elif move is Moves.North:
+        return move_north()
+    elif move is Moves.East:
+        return move_east()
+    elif move is Moves.South:
+        return move_south()
+    raise LookupError(move)
+
+
+switch_on_move = {
+    Moves.West: move_west,
+    Moves.North: move_north,
+    Moves.East: move_east,
+    Moves.South: move_south,
+}
+
+
+def move_dict(move):
+    return switch_on_move[move]()
+
+
+# Every member is covered, so no default is needed
+move_router = EnumDispatch(Moves, switch_on_move)
+
+SCENARIOS = {
+    "TrafficLight": (TrafficLight, light_if_chain, light_dict, light_router),
+    "Moves": (Moves, move_if_chain, move_dict, move_router),
+}
+
+
+def _ns_per_event(func, events):
+    start = time.perf_counter()
+    results = func(events)
+    return results, (time.perf_counter() - start) / len(events) * 1e9
+
+
+def main(count=EVENTS):
+    rnd = random.Random(0)
+    print(f"ns per dispatch, {count:,} random events")
+    print(
+        f"{'enum':<14} {'if/elif':>8} {'dict':>8} {'table':>8} "
+        f"{'batch':>8}"
+    )
+    for name, (enum_type, chain, table, router) in SCENARIOS.items():
+        events = rnd.choices(list(enum_type), k=count)
+        expected, chain_ns = _ns_per_event(
+            lambda e: list(map(chain, e)), events
+        )
+        timings = [chain_ns]
+        for func in (
+            lambda e: list(map(table, e)),
+            lambda e: list(map(router, e)),
+            router.dispatch_many,
+        ):
+            results, ns = _ns_per_event(func, events)
+            assert results == expected, f"{name} results differ"
+            timings.append(ns)
+        print(f"{name:<14} " + " ".join(f"{t:>8.0f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,157 @@
+"""Enum-keyed dispatch compiled into a dense table
+
+- _02_dictionaries.py dispatches on TrafficLight with an if/elif chain (one
+  comparison per branch tried) or a dict of handlers with a .get fallback
+- A dict keyed by enum members hashes each member through Enum.__hash__,
+  a Python-level method; members compare by identity, so the chain is
+  cheap for the first branch but grows with every branch
+- EnumDispatch lays the handlers out in a list indexed by member value, so
+  a dispatch is one type check and one list index, whatever the member
+- Handlers take positional arguments only: collecting **kwargs would cost
+  more than the table lookup saves
+- Coverage is explicit: members without a handler use the default, and
+  validate() rejects a table that leaves members unhandled without one
+- dispatch_many() handles a whole batch of events in one call
+- See dispatch_perf.py for numbers
+
+    router = EnumDispatch(
+        TrafficLight,
+        {TrafficLight.RED: stop, TrafficLight.GREEN: go},
+        default=four_way_stop,
+    )
+    router(light_colour)
+
+Tables are dense for enums with int values packed closely together (the
+usual 1, 2, 3, ... from auto()); other enums are indexed by value through a
+dict, which is still faster than hashing the members themselves.
+"""
+
+
+from enum import Enum
+from typing import Callable, Iterable
+
+# A value-indexed table may have this many times more slots than members
+MAX_SPREAD = 4
+
+_NO_DEFAULT = object()
+
+
+def _unhandled(member: Enum) -> Callable:
+    def handler(*args):
+        raise LookupError(f"No handler for {member!r}")
+
+    return handler
+
+
+class EnumDispatch:
+    """Call the handler registered for an enum member.
+
+    :param enum_type: The enum whose members are dispatched on.
+    :param handlers: Member -> handler, more can be added with register().
+    :param default: Handler for members without one. Without a default,
+        handlers must cover every member; this is checked immediately
+        when handlers are given, and by validate() otherwise.
+    """
+
+    def __init__(
+        self,
+        enum_type: type[Enum],
+        handlers: dict[Enum, Callable] | None = None,
+        *,
+        default: Callable | object = _NO_DEFAULT,
+    ) -> None:
+        self.enum_type = enum_type
+        self.default = default
+        self._handlers: dict[Enum, Callable] = {}
+        for member, handler in (handlers or {}).items():
+            self._add(member, handler)
+        self._compile()
+        if handlers is not None:
+            self.validate()
+
+    def _add(self, member: Enum, handler: Callable) -> None:
+        if type(member) is not self.enum_type:
+            raise TypeError(f"{member!r} is not a {self.enum_type.__name__}")
+        self._handlers[member] = handler
+
+    def register(self, *members: Enum) -> Callable[[Callable], Callable]:
+        """Decorator registering a handler for one or more members."""
+
+        def decorator(handler: Callable) -> Callable:
+            for member in members:
+                self._add(member, handler)
+            self._compile()
+            return handler
+
+        return decorator
+
+    def missing(self) -> list[Enum]:
+        """Return the members without a handler of their own."""
+        return [m for m in self.enum_type if m not in self._handlers]
+
+    def validate(self) -> None:
+        """Raise ValueError if a member has no handler and no default."""
+        missing = self.missing()
+        if missing and self.default is _NO_DEFAULT:
+            names = ", ".join(member.name for member in missing)
+            raise ValueError(
+                f"No handler or default for {self.enum_type.__name__}: "
+                f"{names}"
+            )
+
+    def _handler_for(self, member: Enum) -> Callable:
+        handler = self._handlers.get(member)
+        if handler is not None:
+            return handler
+        if self.default is not _NO_DEFAULT:
+            return self.default  # type: ignore[return-value]
+        return _unhandled(member)
+
+    def _compile(self) -> None:
+        # _value_ is a plain instance attribute; .value goes through a
+        # descriptor, and hash(member) through Enum.__hash__
+        members = list(self.enum_type)
+        values = [member._value_ for member in members]
+        # An enum without members gets an empty (dict) table
+        dense = (
+            bool(values)
+            and all(type(value) is int for value in values)
+            and max(values) - min(values) < MAX_SPREAD * len(values)
+        )
+        if dense:
+            base = min(values)
+            table: list = [None] * (max(values) - base + 1)
+            for member in members:
+                table[member._value_ - base] = self._handler_for(member)
+            self._base: int | None = base
+            self._table: list | dict = table
+        else:
+            self._base = None
+            self._table = {m._value_: self._handler_for(m) for m in members}
+        self._dense = dense
+
+    def __call__(self, member: Enum, *args):
+        """Call the handler for member with args."""
+        if type(member) is not self.enum_type:
+            raise TypeError(f"{member!r} is not a {self.enum_type.__name__}")
+        if self._dense:
+            handler = self._table[member._value_ - self._base]
+        else:
+            handler = self._table[member._value_]
+        return handler(*args)
+
+    def dispatch_many(self, members: Iterable[Enum], *args) -> list:
+        """Dispatch every member in turn; return the handlers' results."""
+        enum_type = self.enum_type
+        table = self._table
+        base = self._base
+        dense = self._dense
+        results = []
+        append = results.append
+        for member in members:
+            if type(member) is not enum_type:
+                raise TypeError(f"{member!r} is not a {enum_type.__name__}")
+            value = member._value_
+            handler = table[value - base] if dense else table[value]
+            append(handler(*args))
+        return results
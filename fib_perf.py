@@ -0,0 +1,67 @@
+"""nth Fibonacci term: generator_fibonacci vs fast doubling
+
+- nth term for n = 10**3 .. 10**6, memo cleared before each run
+- terms in a window just below a huge limit: classic_fibonacci(limit)
+  walks from zero, fib_between starts mid-sequence
+- F(n) mod m for n far beyond anything the generator could reach
+"""
+
+
+from itertools import islice
+import time
+
+import fibonacci
+from quiet_import import import_quietly
+
+generators = import_quietly("_03_yield_and_generators")
+classic_fibonacci = generators.classic_fibonacci
+generator_fibonacci = generators.generator_fibonacci
+
+SIZES = (10**3, 10**4, 10**5, 10**6)
+
+
+def _generator_nth(n):
+    # generator_fibonacci() yields F(1), F(2), ...
+    return next(islice(generator_fibonacci(), n - 1, None))
+
+
+def _doubling_nth(n):
+    fibonacci.fib_pair.cache_clear()
+    return fibonacci.fib(n)
+
+
+def _seconds(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    print(f"{'n':>9} {'generator s':>12} {'doubling s':>11} {'speedup':>9}")
+    for n in SIZES:
+        generator_s, expected = _seconds(_generator_nth, n)
+        doubling_s, result = _seconds(_doubling_nth, n)
+        assert result == expected
+        print(
+            f"{n:>9,} {generator_s:>12.4f} {doubling_s:>11.6f} "
+            f"{generator_s / doubling_s:>8.0f}x"
+        )
+
+    limit = 10**20_000
+    low = limit // 10**10
+    classic_s, classic = _seconds(classic_fibonacci, limit)
+    window_s, window = _seconds(
+        lambda: list(fibonacci.fib_between(low, limit))
+    )
+    assert window == [term for term in classic if low <= term < limit]
+    print(
+        f"\nterms in [limit / 10**10, limit), limit = 10**20000: "
+        f"classic_fibonacci {classic_s:.3f} s, fib_between {window_s:.4f} s"
+    )
+
+    mod_s, value = _seconds(fibonacci.fib_mod, 10**100, 10**9 + 7)
+    print(f"F(10**100) mod 10**9 + 7 = {value} in {mod_s * 1e6:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Fibonacci numbers in O(log n)
+
+- classic_fibonacci/generator_fibonacci in _03_yield_and_generators.py walk
+  the sequence from the start: the nth term costs n big-int additions
+- Fast doubling gets the nth term in O(log n) big-int multiplications:
+      F(2k)     = F(k) * (2 * F(k + 1) - F(k))
+      F(2k + 1) = F(k)**2 + F(k + 1)**2
+- fib_pair is memoized in a bounded LRU cache shared by every function here
+- Range queries jump straight to their first term, then add
+- See fib_perf.py for numbers
+
+Indexing follows F(0) = 0, F(1) = 1, so generator_fibonacci() yields
+F(1), F(2), F(3), ...
+"""
+
+
+import functools
+from itertools import count as count_from, takewhile
+import math
+from typing import Iterator
+
+MEMO_SIZE = 512
+_LOG_PHI = math.log((1 + math.sqrt(5)) / 2)
+_LOG_SQRT5 = math.log(math.sqrt(5))
+
+
+@functools.lru_cache(maxsize=MEMO_SIZE)
+def fib_pair(n: int) -> tuple[int, int]:
+    """Return (F(n), F(n + 1)).
+
+    Recursion depth is log2(n), e.g. 20 for n = 10**6.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if n == 0:
+        return 0, 1
+    a, b = fib_pair(n >> 1)
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    return (d, c + d) if n & 1 else (c, d)
+
+
+def fib(n: int) -> int:
+    """Return F(n)."""
+    return fib_pair(n)[0]
+
+
+def fib_mod(n: int, m: int) -> int:
+    """Return F(n) % m, without ever building the full F(n)."""
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if m <= 0:
+        raise ValueError("m must be positive")
+    a, b = 0, 1 % m
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a) % m
+        d = (a * a + b * b) % m
+        a, b = (d, (c + d) % m) if bit == "1" else (c, d)
+    return a
+
+
+def fib_range(
+    start: int, stop: int | None = None, step: int = 1
+) -> Iterator[int]:
+    """Yield F(start), F(start + step), ... up to, not including, F(stop).
+
+    Works like range(); stop=None yields forever. The first term is found
+    by fast doubling, so starting at 10**6 costs the same as starting at 0.
+    """
+    if start < 0 or (stop is not None and stop < 0):
+        raise ValueError("indices must be non-negative")
+    if step <= 0:
+        raise ValueError("step must be positive")
+
+    a, b = fib_pair(start)
+    if step == 1:
+        indices = range(start, stop) if stop is not None else count_from(start)
+        for _ in indices:
+            yield a
+            a, b = b, a + b
+        return
+
+    # Jump step terms at a time: F(n + k) = F(k - 1) F(n) + F(k) F(n + 1)
+    f_k_minus_1, f_k = fib_pair(step - 1)
+    f_k_plus_1 = f_k_minus_1 + f_k
+    indices = (
+        range(start, stop, step)
+        if stop is not None
+        else count_from(start, step)
+    )
+    for _ in indices:
+        yield a
+        a, b = f_k_minus_1 * a + f_k * b, f_k * a + f_k_plus_1 * b
+
+
+def fib_slice(start: int, stop: int, step: int = 1) -> list[int]:
+    """Return [F(start), F(start + step), ...] below index stop."""
+    return list(fib_range(start, stop, step))
+
+
+def index_at_least(value: int) -> int:
+    """Return the smallest n with F(n) >= value."""
+    if value <= 0:
+        return 0
+    # Binet: F(n) ~ phi**n / sqrt(5), then correct the float estimate
+    n = max(0, int((math.log(value) + _LOG_SQRT5) / _LOG_PHI) - 1)
+    while n > 0 and fib(n) >= value:
+        n -= 1
+    while fib(n) < value:
+        n += 1
+    return n
+
+
+def fib_between(low: int, high: int) -> Iterator[int]:
+    """Yield every Fibonacci number with low <= F(n) < high, in order.
+
+    Starts mid-sequence: nothing below low is computed. F(1) = F(2) = 1 is
+    yielded twice, as the sequence contains it twice.
+    """
+    terms = fib_range(index_at_least(low))
+    return takewhile(lambda term: term < high, terms)
@@ -0,0 +1,91 @@
+"""Open time: memory-mapped DataPoint file vs unpickling vs regenerating
+
+Each method makes the dataset usable and looks up 100 ids. 'cold' first
+evicts the file from the OS page cache (posix_fadvise, where available),
+'warm' runs right after a previous read.
+
+Usage: python file_perf.py [count ...]   (default: 500k records)
+"""
+
+
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+from datapoint_file import DataPointFile, write_store
+from datapoint_gen import make_data_points, make_store
+
+COUNTS = (500_000,)
+LOOKUPS = 100
+
+
+def _evict(path) -> bool:
+    """Drop a file's pages from the page cache, return False if unsupported."""
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    with open(path, "rb") as f:
+        os.fsync(f.fileno())
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    return True
+
+
+def _open_mapped(path, count, ids):
+    with DataPointFile(path) as data_points:
+        return [tuple(data_points[d_id]) for d_id in ids]
+
+
+def _open_pickle(path, count, ids):
+    with open(path, "rb") as f:
+        data_points = pickle.load(f)
+    return [data_points[d_id] for d_id in ids]
+
+
+def _regenerate(path, count, ids):
+    data_points = make_data_points(count)
+    return [data_points[d_id] for d_id in ids]
+
+
+def _ms(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) * 1e3
+
+
+def _bench_count(count, directory):
+    mapped_path = os.path.join(directory, "data_points.dpts")
+    pickle_path = os.path.join(directory, "data_points.pickle")
+    write_store(mapped_path, make_store(count))
+    with open(pickle_path, "wb") as f:
+        pickle.dump(make_data_points(count), f, pickle.HIGHEST_PROTOCOL)
+
+    ids = random.sample(range(count), LOOKUPS)
+    print(
+        f"\n{count:,} records: "
+        f"{os.path.getsize(mapped_path) / 2**20:.1f} MiB mapped, "
+        f"{os.path.getsize(pickle_path) / 2**20:.1f} MiB pickled"
+    )
+    print(f"{'method':<12} {'cold ms':>10} {'warm ms':>10}")
+    for name, func, path in (
+        ("mmap", _open_mapped, mapped_path),
+        ("unpickle", _open_pickle, pickle_path),
+        ("regenerate", _regenerate, None),
+    ):
+        if path is None or _evict(path):
+            cold = f"{_ms(func, path, count, ids):>10.2f}"
+        else:
+            cold = f"{'-':>10}"
+        warm = min(_ms(func, path, count, ids) for _ in range(3))
+        print(f"{name:<12} {cold} {warm:>10.2f}")
+
+
+def main(counts=COUNTS):
+    with tempfile.TemporaryDirectory() as directory:
+        for count in counts:
+            _bench_count(count, directory)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or COUNTS)
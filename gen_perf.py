@@ -0,0 +1,50 @@
+"""Dataset generation: scaling across worker processes
+
+Builds the same dataset with 1, 2, 4, ... workers (up to the CPU count) and
+checks that every worker count produces identical records.
+
+Usage: python gen_perf.py [count] [max_workers]   (default: 5M, CPU count)
+"""
+
+
+import os
+import sys
+import time
+
+from datapoint_gen import make_columns
+
+COUNT = 5_000_000
+
+
+def _worker_counts(max_workers):
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def main(count=COUNT, max_workers=None):
+    print(f"{count:,} records, {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'seconds':>8} {'speedup':>8} {'rows/s':>12}")
+    reference = None
+    baseline = None
+    for workers in _worker_counts(max_workers or os.cpu_count() or 1):
+        start = time.perf_counter()
+        columns = make_columns(count, seed=0, workers=workers)
+        seconds = time.perf_counter() - start
+
+        if reference is None:
+            reference, baseline = columns, seconds
+        elif columns != reference:
+            raise AssertionError(f"workers={workers} changed the records")
+
+        print(
+            f"{workers:>7} {seconds:>8.2f} {baseline / seconds:>7.2f}x "
+            f"{count / seconds:>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
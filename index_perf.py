@@ -0,0 +1,69 @@
+"""Range queries: SortedIndex vs iterating every namedtuple
+
+Builds temp and quality indexes over 500k records, reports build time and
+memory, then times the queries from our workloads:
+- all points with temp between 30 and 45
+- all points with quality > 0.95
+"""
+
+
+import timeit
+
+from datapoint_gen import make_data_points, make_store
+from sorted_index import SortedIndex
+
+COUNT = 500_000
+
+
+def _scan_temp(data_points):
+    return [p.id for p in data_points if 30 <= p.temp <= 45]
+
+
+def _scan_quality(data_points):
+    return [p.id for p in data_points if p.quality > 0.95]
+
+
+def _ms(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e3
+
+
+def main():
+    data_points = make_data_points(COUNT)
+    store = make_store(COUNT)
+
+    temp_index = SortedIndex.from_store(store, "temp")
+    quality_index = SortedIndex.from_store(store, "quality")
+
+    print(f"{COUNT:,} records")
+    print(f"{'index':<8} {'build s':>8} {'MiB':>6}")
+    for index in (temp_index, quality_index):
+        print(
+            f"{index.field:<8} {index.build_seconds:>8.3f} "
+            f"{index.nbytes / 2**20:>6.1f}"
+        )
+
+    queries = [
+        (
+            "30 <= temp <= 45",
+            lambda: _scan_temp(data_points),
+            lambda: list(temp_index.ids(30, 45)),
+            temp_index.count(30, 45),
+        ),
+        (
+            "quality > 0.95",
+            lambda: _scan_quality(data_points),
+            lambda: list(quality_index.ids(0.95, low_inclusive=False)),
+            quality_index.count(0.95, low_inclusive=False),
+        ),
+    ]
+
+    print(f"\n{'query':<18} {'rows':>8} {'scan ms':>8} {'index ms':>9}")
+    for name, scan, query, rows in queries:
+        print(
+            f"{name:<18} {rows:>8,} {_ms(scan, 5):>8.2f} "
+            f"{_ms(query, 5):>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Memory saved by interning on the 1M-record slots_perf workload
+
+Records take their values from the DataPoint ranges (x/y 0..1000,
+temp -10..50) instead of slots_perf's distinct 1 + n, 2 + n, 3 + n:
+- Slots(x, y, temp): mutable, so only the field values are interned
+- NamedTupleABC(x // 100, y // 100, temp): immutable, with 7,381 distinct
+  records, so whole instances are interned
+
+Usage: python intern_perf.py [count]   (default: 1M records)
+"""
+
+
+import sys
+import tracemalloc
+
+from datapoint_gen import make_columns
+from interning import Interner
+from slots_perf import NamedTupleABC, Slots
+
+COUNT = 1_000_000
+
+
+def _plain_slots(xs, ys, temps):
+    return [Slots(x, y, t) for x, y, t in zip(xs, ys, temps)], None
+
+
+def _interned_fields(xs, ys, temps):
+    value = Interner()
+    records = [
+        Slots(value(x), value(y), value(t)) for x, y, t in zip(xs, ys, temps)
+    ]
+    return records, value
+
+
+def _plain_tuples(xs, ys, temps):
+    records = [
+        NamedTupleABC(x // 100, y // 100, t) for x, y, t in zip(xs, ys, temps)
+    ]
+    return records, None
+
+
+def _interned_tuples(xs, ys, temps):
+    record = Interner(NamedTupleABC)
+    records = [record(x // 100, y // 100, t) for x, y, t in zip(xs, ys, temps)]
+    return records, record
+
+
+def _traced(build, columns):
+    # Reading the array columns boxes fresh values inside the trace, just
+    # as generating them would
+    tracemalloc.start()
+    records, interner = build(*columns)
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return traced, interner
+
+
+def main(count=COUNT):
+    _, xs, ys, temps, _ = make_columns(count)
+    columns = (xs, ys, temps)
+
+    print(f"{count:,} records")
+    print(f"{'layout':<36} {'MiB':>7} {'saved':>7} {'hit rate':>9}")
+    for name, plain, interned in (
+        ("Slots, fields", _plain_slots, _interned_fields),
+        ("NamedTupleABC, instances", _plain_tuples, _interned_tuples),
+    ):
+        plain_bytes, _ = _traced(plain, columns)
+        interned_bytes, interner = _traced(interned, columns)
+        stats = interner.stats()
+        print(f"{name + ' (plain)':<36} {plain_bytes / 2**20:>7.1f}")
+        print(
+            f"{name + ' (interned)':<36} {interned_bytes / 2**20:>7.1f} "
+            f"{1 - interned_bytes / plain_bytes:>7.0%} "
+            f"{stats.hit_rate:>9.2%}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,113 @@
+"""Interning (flyweight) factory for small, repetitive records
+
+- DataPoint temp is -10..50 and x/y are 0..1000, yet every record allocates
+  its own field objects (ints above 256 are not cached by CPython)
+- Interner returns one shared object per distinct value or argument tuple
+- Recently used objects are kept in a bounded LRU cache; objects that
+  support weak references also stay shared for as long as anyone still
+  uses them, via a weak-value cache
+- Hit, miss and eviction counts show whether interning pays off
+- See intern_perf.py for memory saved on the slots_perf workload
+
+Only share instances of immutable types (tuples, namedtuples, frozen
+dataclasses). For mutable records, intern their field values instead.
+"""
+
+
+import collections
+from typing import Callable
+import weakref
+
+DEFAULT_MAXSIZE = 1 << 16
+
+_InternStats = collections.namedtuple(
+    "InternStats", "hits misses evictions size maxsize"
+)
+
+
+class InternStats(_InternStats):
+    __slots__ = ()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class Interner:
+    """Return one shared object per distinct key.
+
+    With a factory, interner(*args) returns a shared factory(*args); arguments
+    that compare equal (including 1 and 1.0) share one instance. Without a
+    factory, interner(value) returns a shared object equal to value, keyed
+    by type and value.
+
+    :param factory: Called with the arguments on a cache miss.
+    :param maxsize: Entries kept alive by the LRU cache.
+    """
+
+    def __init__(
+        self, factory: Callable | None = None, maxsize: int = DEFAULT_MAXSIZE
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.factory = factory
+        self.maxsize = maxsize
+        self._lru: collections.OrderedDict = collections.OrderedDict()
+        self._weak: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __call__(self, *args):
+        if self.factory is None:
+            (value,) = args
+            key = (type(value), value)
+        else:
+            key = args
+
+        lru = self._lru
+        try:
+            obj = lru[key]
+        except KeyError:
+            pass
+        else:
+            lru.move_to_end(key)
+            self._hits += 1
+            return obj
+
+        # Evicted from the LRU, but still alive somewhere
+        obj = self._weak.get(key)
+        if obj is not None:
+            self._hits += 1
+        else:
+            self._misses += 1
+            obj = args[0] if self.factory is None else self.factory(*args)
+            try:
+                self._weak[key] = obj
+            except TypeError:  # No weak references (e.g. int, tuple)
+                pass
+
+        lru[key] = obj
+        if len(lru) > self.maxsize:
+            lru.popitem(last=False)
+            self._evictions += 1
+        return obj
+
+    def stats(self) -> InternStats:
+        return InternStats(
+            self._hits,
+            self._misses,
+            self._evictions,
+            len(self._lru),
+            self.maxsize,
+        )
+
+    def clear(self) -> None:
+        """Drop every cached object and reset the counters."""
+        self._lru.clear()
+        self._weak.clear()
+        self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._lru)
@@ -0,0 +1,125 @@
+"""JSON arrays: json.load/json.dump vs json_stream
+
+For arrays of movie_data-shaped objects (as in _02_dictionaries.py):
+- write: json.dump of a list vs write_array from a generator
+- read: json.load vs iterating over iter_array
+
+Reports objects/sec, and the peak memory tracemalloc sees while reading in
+a separate run: json.load grows with the file, iter_array stays flat.
+
+Usage: python json_perf.py [count ...]
+"""
+
+
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from json_stream import iter_array, write_array
+
+COUNTS = (10_000, 100_000, 500_000)
+COUNTRIES = ("United States", "United Kingdom", "France", "Japan", "Canada")
+# Numbers that a chunk boundary can cut after ".", "e" or "e+"
+CHECK_DOCUMENT = (
+    '[1.5e10, 2, -12.25, 3E+2, -0.0, 1e-5, [2.5e3], {"a": -7.25}, '
+    '"Movie \u00e9", true, null]'
+)
+
+
+def _movies(count, seed=0):
+    rnd = random.Random(seed)
+    for n in range(count):
+        yield {
+            "year": str(rnd.randint(1920, 2024)),
+            "country": rnd.choice(COUNTRIES),
+            "title": f"Movie {n}",
+            "duration": f"{rnd.randint(70, 200)} min",
+        }
+
+
+def _json_load(path):
+    with open(path, "rb") as f:
+        return sum(1 for _ in json.load(f))
+
+
+def _iter_array(path):
+    with open(path, "rb") as f:
+        return sum(1 for _ in iter_array(f))
+
+
+def _json_dump(path, count):
+    with open(path, "w") as f:
+        json.dump(list(_movies(count)), f)
+
+
+def _write_array(path, count):
+    with open(path, "w") as f:
+        write_array(f, _movies(count))
+
+
+def _check_chunk_sizes(document=CHECK_DOCUMENT):
+    # Every chunk size up to the whole document, text and binary
+    expected = json.loads(document)
+    data = document.encode()
+    for chunk_size in range(1, len(data) + 2):
+        for file in (io.StringIO(document), io.BytesIO(data)):
+            elements = list(iter_array(file, chunk_size=chunk_size))
+            assert elements == expected, chunk_size
+
+
+def _seconds(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def _traced_peak(func, *args):
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main(counts=COUNTS):
+    _check_chunk_sizes()
+    print(
+        f"{'objects':>10} {'MB':>8} {'operation':<12} {'objects/sec':>12} "
+        f"{'peak traced MB':>15}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "movies.json")
+        for count in counts:
+            rows = []
+            for name, func in (
+                ("json.dump", _json_dump),
+                ("write_array", _write_array),
+            ):
+                seconds = _seconds(func, path, count)
+                rows.append((name, count / seconds, None))
+            size = os.path.getsize(path) / 1e6
+
+            for name, func in (
+                ("json.load", _json_load),
+                ("iter_array", _iter_array),
+            ):
+                seconds = _seconds(func, path)
+                assert func(path) == count
+                peak = _traced_peak(func, path) / 1e6
+                rows.append((name, count / seconds, peak))
+
+            for name, rate, peak in rows:
+                peak_text = "" if peak is None else f"{peak:.1f}"
+                print(
+                    f"{count:>10,} {size:>8.1f} {name:<12} {rate:>12,.0f} "
+                    f"{peak_text:>15}"
+                )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or COUNTS)
@@ -0,0 +1,211 @@
+"""Incremental reader and writer for top-level JSON arrays
+
+- json.load/json.loads parse a whole document at once: a multi-GB array of
+  movie_data-shaped objects needs several times its file size in RAM
+- iter_array() reads a file object in fixed-size chunks and yields one
+  element at a time, decoded by json.JSONDecoder.raw_decode; only the
+  unparsed tail of the input and the current element are held
+- ArrayWriter/write_array() stream elements back out as one JSON array
+- See json_perf.py for throughput and peak memory against json.load
+
+    with open("movies.json", "rb") as f:
+        for movie in iter_array(f):
+            ...
+
+Error positions in a JSONDecodeError are relative to the buffered input,
+not to the start of the file.
+"""
+
+
+import codecs
+import json
+from typing import IO, Any, Iterable, Iterator
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_START = "-0123456789"
+# Characters a number can continue with: "1." or "1e+" at the end of a chunk
+# decodes as 1, with the rest of the number still unread
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+class _Buffer:
+    """Text read so far that has not been parsed yet."""
+
+    __slots__ = ("_file", "_chunk_size", "_decoder", "text", "pos", "eof")
+
+    def __init__(self, file: IO, chunk_size: int, encoding: str) -> None:
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, at_least: int = 0) -> bool:
+        """Read at least another chunk; return False at end of file."""
+        chunk = ""
+        while not chunk:
+            if self.eof:
+                return False
+            data = self._file.read(max(self._chunk_size, at_least))
+            self.eof = not data
+            if isinstance(data, bytes):
+                # A chunk may end mid-character and decode to nothing yet
+                chunk = self._decoder.decode(data, final=self.eof)
+            else:
+                chunk = data
+        # Drop what has been parsed, so the buffer never holds more than the
+        # unparsed tail plus one read
+        self.text = self.text[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def skip_whitespace(self) -> str:
+        """Skip whitespace; return the next character, "" at end of file."""
+        while True:
+            text, pos = self.text, self.pos
+            while pos < len(text) and text[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(text):
+                return text[pos]
+            if not self.fill():
+                return ""
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.text, self.pos)
+
+
+def iter_array(
+    file: IO,
+    chunk_size: int = CHUNK_SIZE,
+    encoding: str = "utf-8",
+    decoder: json.JSONDecoder | None = None,
+) -> Iterator[Any]:
+    """Yield the elements of the JSON array that makes up the file.
+
+    :param file: A text or binary file object, positioned at the array.
+    :param chunk_size: Characters (text) or bytes (binary) read at a time.
+    :param encoding: Encoding of a binary file.
+    :param decoder: Decoder for the elements, e.g. one with object_hook.
+    :raises json.JSONDecodeError: If the input is not a JSON array.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    raw_decode = (decoder or json.JSONDecoder()).raw_decode
+    buffer = _Buffer(file, chunk_size, encoding)
+
+    if buffer.skip_whitespace() != "[":
+        raise buffer.error("Expecting '['")
+    buffer.pos += 1
+    if buffer.skip_whitespace() == "]":
+        buffer.pos += 1
+    else:
+        while True:
+            if not buffer.skip_whitespace():
+                raise buffer.error("Unterminated array")
+            try:
+                element, end = raw_decode(buffer.text, buffer.pos)
+            except json.JSONDecodeError:
+                end = None
+            # An element that ends with the buffer may continue in the next
+            # chunk (the buffer ended mid-element, or a number was cut short
+            # after its last digit, ".", "e" or "e+"): read more, at least
+            # doubling the unparsed tail so that retries stay linear in the
+            # element size
+            if (
+                end is None
+                or end == len(buffer.text)
+                or (
+                    buffer.text[buffer.pos] in _NUMBER_START
+                    and not buffer.text[end:].lstrip(_NUMBER_CHARS)
+                )
+            ):
+                unparsed = len(buffer.text) - buffer.pos
+                if buffer.fill(unparsed):
+                    continue
+                if end is None:
+                    raw_decode(buffer.text, buffer.pos)  # Raises the error
+            buffer.pos = end
+            yield element
+
+            separator = buffer.skip_whitespace()
+            buffer.pos += 1
+            if separator == "]":
+                break
+            if separator != ",":
+                buffer.pos -= 1
+                raise buffer.error("Expecting ',' delimiter or ']'")
+
+    if buffer.skip_whitespace():
+        raise buffer.error("Extra data")
+
+
+class ArrayWriter:
+    """Write a JSON array one element at a time.
+
+        with ArrayWriter(f) as writer:
+            for movie in movies:
+                writer.write(movie)
+
+    If the with block raises, the array is left unterminated, so a failed
+    export cannot be mistaken for a complete, shorter one.
+
+    :param file: A text file object.
+    :param encoder: Encoder for the elements, defaults to compact output
+        with one element per line.
+    """
+
+    def __init__(
+        self, file: IO[str], encoder: json.JSONEncoder | None = None
+    ) -> None:
+        self._file = file
+        self._encode = (
+            encoder or json.JSONEncoder(separators=(",", ":"))
+        ).encode
+        self._separator = "[\n"
+        self.count = 0
+        self.closed = False
+
+    def write(self, element: Any) -> None:
+        if self.closed:
+            raise ValueError("write to closed ArrayWriter")
+        self._file.write(self._separator + self._encode(element))
+        self._separator = ",\n"
+        self.count += 1
+
+    def write_many(self, elements: Iterable) -> None:
+        for element in elements:
+            self.write(element)
+
+    def close(self) -> None:
+        """Terminate the array; the file itself is left open."""
+        if not self.closed:
+            self._file.write("[]\n" if not self.count else "\n]\n")
+            self.closed = True
+
+    def __enter__(self) -> "ArrayWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # No closing "]": readers must see the export as broken
+            self.closed = True
+
+
+def write_array(
+    file: IO[str],
+    elements: Iterable,
+    encoder: json.JSONEncoder | None = None,
+) -> int:
+    """Write elements as one JSON array; return the number written.
+
+    If elements raises, the array is left unterminated.
+    """
+    with ArrayWriter(file, encoder) as writer:
+        writer.write_many(elements)
+    return writer.count
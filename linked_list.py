@@ -0,0 +1,61 @@
+"""Singly linked list that scales to millions of nodes
+
+- next() in _03_yield_and_generators.py recurses once per node through
+  'yield from': every value is passed up the whole generator chain, so a
+  traversal is O(n**2) and hits the recursion limit at ~1000 nodes
+- Here nodes use __slots__ and are linked as they are created, back to front,
+  instead of building a list and then assigning node.next pair by pair
+- Traversal is a plain loop, optionally in batches of nodes
+- See linked_list_perf.py for numbers
+"""
+
+
+from typing import Iterable, Iterator
+
+
+class Node:
+    __slots__ = ("data", "next")
+
+    def __init__(self, data: object, next: "Node | None" = None) -> None:
+        self.data: object = data
+        self.next: Node | None = next
+
+    def __repr__(self) -> str:
+        return f"Node({self.data!r})"
+
+
+def from_iterable(values: Iterable) -> Node | None:
+    """Build a linked list and return its head (None if values is empty)."""
+    if not isinstance(values, (list, tuple, range)):
+        values = list(values)
+    head = None
+    for value in reversed(values):
+        head = Node(value, head)
+    return head
+
+
+def iter_nodes(node: Node | None) -> Iterator[Node]:
+    while node:
+        yield node
+        node = node.next
+
+
+def iter_values(node: Node | None) -> Iterator:
+    while node:
+        yield node.data
+        node = node.next
+
+
+def iter_batches(node: Node | None, size: int) -> Iterator[list[Node]]:
+    """Yield the nodes in lists of up to size nodes."""
+    if size <= 0:
+        raise ValueError("size must be positive")
+    while node:
+        batch = []
+        append = batch.append
+        for _ in range(size):
+            if node is None:
+                break
+            append(node)
+            node = node.next
+        yield batch
@@ -0,0 +1,95 @@
+"""Linked list build and traversal: _03_yield_and_generators vs linked_list
+
+- build: list of _Node + itertools.pairwise links vs linked_list.from_iterable
+- traverse: recursive next(), next_iter(), linked_list.iter_nodes() and
+  linked_list.iter_batches()
+
+next() fails with RecursionError beyond ~1000 nodes; it is shown as such.
+
+Usage: python linked_list_perf.py [size ...]   (default: 10k .. 10M nodes)
+"""
+
+
+import itertools
+import sys
+import time
+
+import linked_list
+from quiet_import import import_quietly
+
+generators = import_quietly("_03_yield_and_generators")
+_Node = generators._Node
+next = generators.next
+next_iter = generators.next_iter
+
+SIZES = (10_000, 100_000, 1_000_000, 10_000_000)
+BATCH_SIZE = 1024
+
+
+def _pairwise_build(size):
+    nodes = [_Node(n) for n in range(size)]
+    for node_pair in itertools.pairwise(nodes):
+        node_pair[0].next = node_pair[1]
+    return nodes[0]
+
+
+def _consume(nodes):
+    for _ in nodes:
+        pass
+
+
+def _consume_batches(batches):
+    for batch in batches:
+        for _ in batch:
+            pass
+
+
+def _seconds(func, *args):
+    start = time.perf_counter()
+    try:
+        func(*args)
+    except RecursionError:
+        return None
+    return time.perf_counter() - start
+
+
+def _format(seconds):
+    return (
+        f"{'RecursionError':>14}" if seconds is None else f"{seconds:>14.3f}"
+    )
+
+
+def main(sizes=SIZES):
+    columns = (
+        "pairwise build",
+        "bulk build",
+        "next()",
+        "next_iter()",
+        "iter_nodes()",
+        "iter_batches()",
+    )
+    print("Seconds per operation")
+    print(f"{'nodes':>10} " + " ".join(f"{c:>14}" for c in columns))
+    for size in sizes:
+        pairwise = _seconds(_pairwise_build, size)
+
+        start = time.perf_counter()
+        head = linked_list.from_iterable(range(size))
+        bulk = time.perf_counter() - start
+
+        results = (
+            pairwise,
+            bulk,
+            _seconds(_consume, next(head)),
+            _seconds(_consume, next_iter(head)),
+            _seconds(_consume, linked_list.iter_nodes(head)),
+            _seconds(
+                _consume_batches, linked_list.iter_batches(head, BATCH_SIZE)
+            ),
+        )
+        print(f"{size:>10,} " + " ".join(map(_format, results)))
+        del head
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
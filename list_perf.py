@@ -1,25 +1,16 @@
-import collections
 import cProfile
+import functools
 import random
 from pprint import pprint as pp
 
-DataPoint = collections.namedtuple("DataPoint", "id x y temp quality")
+from datapoint_gen import make_data_points
 
 
 # Make data points with random data
+# random.seed(0) keeps the shuffle and interesting id's reproducible
 def _make_data_points():
     random.seed(0)
-    data_points = []
-    for d_id in range(500_000):
-        data_point = DataPoint(
-            id=d_id,
-            x=random.randint(0, 1000),
-            y=random.randint(0, 1000),
-            temp=random.randint(-10, 50),
-            quality=random.random(),
-        )
-        data_points.append(data_point)
-    return data_points
+    return make_data_points(500_000, seed=0)
 
 
 # Reorder data because we are using auto-incrementing id's
@@ -49,14 +40,26 @@ def _print_results(interesting_data_points):
     pp(interesting_data_points)
 
 
-# Do not include the making of data points in the profile
-data_points = _make_data_points()
+# Build the data points on first use, then reuse them
+# Importing this module stays cheap (see python -X importtime)
+@functools.cache
+def get_data_points():
+    return _make_data_points()
 
 
 def main():
+    data_points = get_data_points()
     _shuffle_data_points(data_points)
     interesting_data_points = _locate_interesting_ids(data_points)
     _print_results(interesting_data_points)
 
 
-cProfile.run("main()")
+# bench.py times main() alone, without the profiler
+bench_setup = get_data_points
+bench = main
+
+
+if __name__ == "__main__":
+    # Do not include the making of data points in the profile
+    get_data_points()
+    cProfile.run("main()")
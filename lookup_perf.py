@@ -0,0 +1,75 @@
+"""Multi-id lookup: per-id loops vs lookup_many
+
+500k shuffled records, looking up batches of 100 to 50k ids (10% unknown).
+The list nested loop is only timed for the smallest batch; it is
+O(ids x points).
+"""
+
+
+import random
+import time
+import timeit
+
+from batch_lookup import SortedIdColumn, lookup_many
+from datapoint_gen import make_data_points, make_store
+
+COUNT = 500_000
+BATCH_SIZES = (100, 10_000, 50_000)
+
+
+def _nested_loop(data_points, ids):
+    found = []
+    for d_id in ids:
+        for data_point in data_points:
+            if d_id == data_point.id:
+                found.append(data_point)
+                break
+    return found
+
+
+def _per_id_probe(data_points, ids):
+    found = []
+    for d_id in ids:
+        if d_id in data_points:
+            found.append(data_points[d_id])
+    return found
+
+
+def _ms(func, number=3):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e3
+
+
+def main():
+    random.seed(0)
+    data_list = make_data_points(COUNT)
+    random.shuffle(data_list)
+    data_dict = {p.id: p for p in data_list}
+    store = make_store(COUNT)
+
+    start = time.perf_counter()
+    id_column = SortedIdColumn(data_list)
+    column_ms = (time.perf_counter() - start) * 1e3
+    print(f"{COUNT:,} records, SortedIdColumn built in {column_ms:.0f} ms")
+
+    print(
+        f"\n{'ids':>7} {'list loop':>10} {'list batch':>11} "
+        f"{'dict loop':>10} {'dict batch':>11} {'store batch':>12}  (ms)"
+    )
+    for size in BATCH_SIZES:
+        ids = random.sample(range(int(COUNT * 1.1)), size)
+        nested = (
+            f"{_ms(lambda: _nested_loop(data_list, ids), 1):>10.1f}"
+            if size <= 100
+            else f"{'-':>10}"
+        )
+        print(
+            f"{size:>7,} {nested} "
+            f"{_ms(lambda: lookup_many(data_list, ids, id_column)):>11.2f} "
+            f"{_ms(lambda: _per_id_probe(data_dict, ids)):>10.2f} "
+            f"{_ms(lambda: lookup_many(data_dict, ids)):>11.2f} "
+            f"{_ms(lambda: lookup_many(store, ids)):>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
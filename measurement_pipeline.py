@@ -0,0 +1,214 @@
+"""Streaming pipeline over Measurement feeds (CSV or JSON Lines)
+
+- The Measurement section of _03_yield_and_generators.py builds lists, sets
+  and dicts from an in-memory list; a multi-GB feed does not fit
+- Here every stage is a generator: parse -> filter -> project -> aggregate
+- Input is read in large binary chunks and split into lines, so only one
+  chunk and one row are held at a time
+- aggregate() feeds every aggregator from a single pass over the stream;
+  Distinct and ById hold one entry per distinct key, never the rows
+- Throughput counts rows and reports rows/sec
+- See pipeline_perf.py for numbers
+
+    rows = pipeline(
+        read_measurements("feed.csv"),
+        where(lambda m: m.value >= 70),
+    )
+    results = aggregate(
+        rows, count=Count(), values=Distinct("value"), by_id=ById("value")
+    )
+"""
+
+
+import codecs
+import collections
+import csv
+import json
+from operator import attrgetter
+import os
+import time
+from typing import IO, Callable, Iterable, Iterator
+
+Measurement = collections.namedtuple("Measurement", "id x y value")
+
+CHUNK_SIZE = 1 << 20
+
+Stage = Callable[[Iterable], Iterable]
+
+
+def _number(text: str) -> int | float:
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def iter_lines(
+    file: IO[bytes], chunk_size: int = CHUNK_SIZE, encoding: str = "utf-8"
+) -> Iterator[str]:
+    """Yield the lines of a binary file, without line endings.
+
+    The file is read chunk_size bytes at a time; a line split across two
+    chunks is joined before it is yielded.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    tail = ""
+    while chunk := file.read(chunk_size):
+        lines = (tail + decoder.decode(chunk)).split("\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line.removesuffix("\r")
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield tail.removesuffix("\r")
+
+
+def parse_csv(lines: Iterable[str], header: bool = True) -> Iterator:
+    """Parse id,x,y,value rows into Measurements, skipping blank lines."""
+    rows = csv.reader(lines)
+    if header:
+        next(rows, None)
+    for row in rows:
+        if not row:
+            continue
+        m_id, x, y, value = row
+        yield Measurement(m_id, int(x), int(y), _number(value))
+
+
+def parse_jsonl(lines: Iterable[str]) -> Iterator:
+    """Parse one {"id": ..., "x": ..., "y": ..., "value": ...} per line."""
+    loads = json.loads
+    for line in lines:
+        if line:
+            record = loads(line)
+            yield Measurement(
+                record["id"], record["x"], record["y"], record["value"]
+            )
+
+
+_PARSERS = {".csv": parse_csv, ".jsonl": parse_jsonl, ".ndjson": parse_jsonl}
+
+
+def read_measurements(
+    path: str | os.PathLike, chunk_size: int = CHUNK_SIZE
+) -> Iterator:
+    """Stream Measurements from a .csv or .jsonl/.ndjson file."""
+    suffix = os.path.splitext(path)[1].lower()
+    try:
+        parse = _PARSERS[suffix]
+    except KeyError:
+        raise ValueError(f"Unsupported feed format: {suffix!r}") from None
+    with open(path, "rb") as f:
+        yield from parse(iter_lines(f, chunk_size))
+
+
+def where(predicate: Callable) -> Stage:
+    """Stage that keeps the rows for which predicate(row) is true."""
+
+    def stage(rows):
+        return filter(predicate, rows)
+
+    return stage
+
+
+def project(*fields: str) -> Stage:
+    """Stage that keeps one field (as a value) or several (as a tuple)."""
+    if not fields:
+        raise ValueError("project() needs at least one field")
+    # attrgetter returns a value for one field, a tuple for several
+    get = attrgetter(*fields)
+
+    def stage(rows):
+        return map(get, rows)
+
+    return stage
+
+
+def pipeline(source: Iterable, *stages: Stage) -> Iterable:
+    """Chain stages lazily: stages[-1](...(stages[0](source)))."""
+    for stage in stages:
+        source = stage(source)
+    return source
+
+
+class Count:
+    def __init__(self) -> None:
+        self.result = 0
+
+    def add(self, row) -> None:
+        self.result += 1
+
+
+class Distinct:
+    """Distinct values of one field (or of whole rows if field is None)."""
+
+    def __init__(self, field: str | None = None) -> None:
+        self.field = field
+        self._get = (lambda row: row) if field is None else attrgetter(field)
+        self.result: set = set()
+
+    def add(self, row) -> None:
+        self.result.add(self._get(row))
+
+
+class ById:
+    """Map of row id -> field value; a later row for the same id wins."""
+
+    def __init__(self, field: str, key: str = "id") -> None:
+        self.field = field
+        self.key = key
+        self._get = attrgetter(key, field)
+        self.result: dict = {}
+
+    def add(self, row) -> None:
+        key, value = self._get(row)
+        self.result[key] = value
+
+
+class Sum:
+    def __init__(self, field: str) -> None:
+        self.field = field
+        self._get = attrgetter(field)
+        self.result = 0
+
+    def add(self, row) -> None:
+        self.result += self._get(row)
+
+
+def aggregate(rows: Iterable, **aggregators) -> dict:
+    """Feed every row to every aggregator in one pass.
+
+    :param rows: Any iterable, typically a pipeline().
+    :param aggregators: name=aggregator; each has add(row) and result.
+    :return: A dict of name -> aggregator.result.
+    """
+    adds = [aggregator.add for aggregator in aggregators.values()]
+    for row in rows:
+        for add in adds:
+            add(row)
+    return {name: agg.result for name, agg in aggregators.items()}
+
+
+class Throughput:
+    """Pass-through stage that counts rows and times the stream.
+
+    seconds run from the first row requested until the stream ends, so
+    rows_per_second is the throughput of the pipeline as a whole.
+    """
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.seconds = 0.0
+
+    def __call__(self, rows: Iterable) -> Iterator:
+        start = time.perf_counter()
+        try:
+            for row in rows:
+                self.rows += 1
+                yield row
+        finally:
+            self.seconds += time.perf_counter() - start
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
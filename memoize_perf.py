@@ -0,0 +1,83 @@
+"""Cache hit overhead: functools.lru_cache vs memoize.cached
+
+Every call is a hit on a warm cache of KEYS integers, so the numbers are the
+cost of the cache itself. A final run shows what caching buys for an
+expensive predicate evaluated over overlapping ranges.
+
+Usage: python memoize_perf.py [calls]
+"""
+
+
+import functools
+import sys
+import timeit
+
+from memoize import cached, dump_stats
+
+CALLS = 1_000_000
+KEYS = 1000
+
+
+def is_odd(n):
+    return n % 2 == 1
+
+
+def is_prime(n):
+    if n < 2:
+        return False
+    return all(n % d for d in range(2, int(n**0.5) + 1))
+
+
+VARIANTS = {
+    "uncached": lambda f: f,
+    "lru_cache": functools.lru_cache(maxsize=2 * KEYS),
+    "cached": cached(maxsize=2 * KEYS),
+    "cached, ttl": cached(maxsize=2 * KEYS, ttl=3600),
+    "cached, maxbytes": cached(maxsize=None, maxbytes=1 << 20),
+    "cached, thread_safe": cached(maxsize=2 * KEYS, thread_safe=True),
+}
+
+
+def _ns_per_call(func, calls):
+    keys = list(range(KEYS)) * (calls // KEYS)
+    for key in range(KEYS):  # Warm up
+        func(key)
+    seconds = timeit.timeit(lambda: list(map(func, keys)), number=1)
+    return seconds / len(keys) * 1e9
+
+
+def _overlapping_ranges(func, ranges=200, width=5000, step=500):
+    return sum(
+        sum(map(func, range(start, start + width)))
+        for start in range(0, ranges * step, step)
+    )
+
+
+def main(calls=CALLS):
+    print(f"ns per call, {calls:,} hits on {KEYS:,} keys")
+    print(f"{'variant':<20} {'is_odd':>8} {'is_prime':>9}")
+    for name, decorate in VARIANTS.items():
+        timings = (
+            _ns_per_call(decorate(func), calls) for func in (is_odd, is_prime)
+        )
+        print(f"{name:<20} " + " ".join(f"{t:>8.0f}" for t in timings))
+
+    print("\nis_prime over 200 overlapping ranges of 5,000 numbers, seconds")
+    expected = None
+    for name, decorate in (
+        ("uncached", lambda f: f),
+        ("lru_cache", functools.lru_cache(maxsize=None)),
+        ("cached", cached(maxsize=None)),
+    ):
+        func = decorate(lambda n: is_prime(n))
+        start = timeit.default_timer()
+        result = _overlapping_ranges(func)
+        print(f"{name:<20} {timeit.default_timer() - start:>8.3f}")
+        expected = expected or result
+        assert result == expected
+    print()
+    dump_stats()
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,161 @@
+"""Per-phase memory profiling in isolated processes
+
+A scenario module exposes LAYOUTS, a dict of name -> build(count), where
+build returns whatever keeps its records alive (see slots_perf.py).
+
+Each phase (one layout at one count) runs in a fresh interpreter, so
+nothing freed or fragmented by an earlier phase skews the next one:
+1. build untraced: RSS growth and peak RSS (tracemalloc's own bookkeeping
+   would inflate both)
+2. build again under tracemalloc: current and peak traced memory
+
+Sampling mode (sample=N) traces only N records and scales the traced
+figures up to count, for counts where a full traced build is too slow.
+RSS is still measured on the full, untraced build.
+
+Usage: python memprofile.py slots_perf "class + __slots__" 1000000
+"""
+
+
+import argparse
+import gc
+import importlib
+import json
+import mmap
+import subprocess
+import sys
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore
+
+
+def _rss_bytes() -> int | None:
+    """Current resident set size, None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * mmap.PAGESIZE
+    except OSError:
+        return None
+
+
+def reset_peak_rss() -> None:
+    """Reset the peak RSS to the current RSS, where Linux allows it."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process, None where unavailable."""
+    # VmHWM is this process' own peak; ru_maxrss can be inherited from the
+    # parent across fork/exec on Linux
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _growth(after, before):
+    return None if after is None or before is None else after - before
+
+
+def measure(build, count: int, sample: int | None = None) -> dict:
+    """Measure one phase in this process.
+
+    Prefer measure_isolated(); in-process figures are affected by whatever
+    ran before.
+
+    :param build: Called as build(count), returns the records.
+    :param count: Number of records.
+    :param sample: Trace only this many records and scale up to count.
+    :return: A dict of memory figures in bytes, see measure_isolated().
+    """
+    gc.collect()
+    reset_peak_rss()
+    rss_before = _rss_bytes()
+    records = build(count)
+    rss_after = _rss_bytes()
+    peak_rss_after = peak_rss_bytes()
+    del records
+    gc.collect()
+
+    traced_count = min(sample, count) if sample else count
+    tracemalloc.start()
+    records = build(traced_count)
+    traced, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+
+    scale = count / traced_count if traced_count else 0
+    return {
+        "count": count,
+        "traced_count": traced_count,
+        "sampled": traced_count != count,
+        "bytes_per_record": traced / traced_count if traced_count else 0.0,
+        "traced_bytes": round(traced * scale),
+        "traced_peak_bytes": round(traced_peak * scale),
+        "rss_bytes": _growth(rss_after, rss_before),
+        # High-water mark of the process above its RSS before the build
+        "peak_rss_bytes": _growth(peak_rss_after, rss_before),
+    }
+
+
+def measure_isolated(
+    module: str,
+    layout: str,
+    count: int,
+    sample: int | None = None,
+    timeout: float | None = None,
+) -> dict:
+    """Measure one phase in a fresh interpreter.
+
+    :param module: Importable name of a module with a LAYOUTS dict.
+    :param layout: Key into LAYOUTS.
+    :param count: Number of records.
+    :param sample: Trace only this many records and scale up to count.
+    :param timeout: Seconds to wait for the phase, None to wait forever.
+    :return: count, traced_count, sampled, bytes_per_record, traced_bytes,
+        traced_peak_bytes, rss_bytes (RSS growth) and peak_rss_bytes (growth
+        of the process high-water mark). RSS figures are None where the
+        platform cannot report them.
+    :raises subprocess.CalledProcessError: If the phase fails.
+    """
+    args = [sys.executable, __file__, module, layout, str(count)]
+    if sample:
+        args += ["--sample", str(sample)]
+    completed = subprocess.run(
+        args, capture_output=True, text=True, timeout=timeout, check=True
+    )
+    return json.loads(completed.stdout)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure one layout build and print the result as JSON."
+    )
+    parser.add_argument("module")
+    parser.add_argument("layout")
+    parser.add_argument("count", type=int)
+    parser.add_argument("--sample", type=int)
+    args = parser.parse_args(argv)
+
+    layouts = importlib.import_module(args.module).LAYOUTS
+    result = measure(layouts[args.layout], args.count, args.sample)
+    json.dump(result, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
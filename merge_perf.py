@@ -0,0 +1,76 @@
+"""Merging rosters: {**a, **b, ...} vs MergedView
+
+For each merge size (total keys across all mappings) and number of reads,
+time building the merged mapping plus the reads. The eager merge pays for
+every key up front; the view pays per read, once per layer searched.
+
+Usage: python merge_perf.py [layers]
+"""
+
+
+import random
+import sys
+import time
+
+from merged_view import MergedView
+
+LAYERS = 2
+SIZES = (1_000, 100_000, 1_000_000)
+READS = (10, 1_000, 100_000)
+
+
+def _rosters(size, layers, seed=0):
+    rnd = random.Random(seed)
+    per_layer = size // layers
+    # Layers overlap by half, so later layers hide some earlier keys
+    return [
+        {
+            f"player{n}": rnd.randint(18, 40)
+            for n in range(i * per_layer // 2, i * per_layer // 2 + per_layer)
+        }
+        for i in range(layers)
+    ]
+
+
+def _eager(rosters, keys):
+    merged = {}
+    for roster in rosters:
+        merged.update(roster)
+    return [merged[key] for key in keys]
+
+
+def _view(rosters, keys):
+    merged = MergedView(*rosters)
+    return [merged[key] for key in keys]
+
+
+def _seconds(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(layers=LAYERS):
+    print(f"{layers} layers, build + reads, milliseconds")
+    print(
+        f"{'keys':>10} {'reads':>8} {'eager':>10} {'view':>10} "
+        f"{'faster':>7}"
+    )
+    for size in SIZES:
+        rosters = _rosters(size, layers)
+        all_keys = list(MergedView(*rosters))
+        rnd = random.Random(size)
+        for reads in READS:
+            keys = rnd.choices(all_keys, k=reads)
+            expected, eager = _seconds(_eager, rosters, keys)
+            result, view = _seconds(_view, rosters, keys)
+            assert result == expected
+            faster = "view" if view < eager else "eager"
+            print(
+                f"{size:>10,} {reads:>8,} {eager * 1e3:>10.3f} "
+                f"{view * 1e3:>10.3f} {faster:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
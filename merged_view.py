@@ -0,0 +1,131 @@
+"""Read-optimized merged view over several mappings
+
+- Every merge in _02_dictionaries.py (the loop, .copy()/.update(), the
+  comprehension, {**line_one, **line_two}) copies every entry of every
+  input, O(total size) before the first read
+- MergedView keeps references to the inputs and looks a key up in them
+  newest first, so building it is O(number of mappings) and a read costs
+  at most one lookup per mapping
+- Last wins, as with {**line_one, **line_two}: a key in a later mapping
+  hides the same key in earlier ones
+- compact() merges layers into one dict when the view gets too deep;
+  add() does so automatically past max_depth
+- default gives defaultdict-style fallback values for missing keys, like
+  default_movie_data, without inserting them anywhere
+- See merge_perf.py for where the view beats an eager merge
+
+Changes to the inputs show through the view, except in layers that have
+been compacted, which are copies.
+"""
+
+
+from collections.abc import Mapping
+from typing import Callable, Iterator
+
+DEFAULT_MAX_DEPTH = 16
+
+_MISSING = object()
+
+
+class MergedView(Mapping):
+    """Read-only mapping over maps, where later maps win.
+
+        team = MergedView(line_one, line_two)
+        team["Alex"]
+
+    :param maps: Mappings, oldest first.
+    :param default: Called with no arguments for a missing key, like
+        defaultdict's default_factory; None raises KeyError.
+    :param max_depth: add() compacts the oldest layers beyond this depth.
+    """
+
+    def __init__(
+        self,
+        *maps: Mapping,
+        default: Callable[[], object] | None = None,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+    ) -> None:
+        if max_depth <= 0:
+            raise ValueError("max_depth must be positive")
+        # Newest first, the order lookups go in
+        self._layers: list[Mapping] = list(reversed(maps))
+        self.default = default
+        self.max_depth = max_depth
+
+    @property
+    def maps(self) -> list[Mapping]:
+        """The layers, oldest first."""
+        return self._layers[::-1]
+
+    @property
+    def depth(self) -> int:
+        return len(self._layers)
+
+    def __getitem__(self, key):
+        # get() with a sentinel: a raised and caught KeyError per layer
+        # missed would cost more than the lookup itself
+        for layer in self._layers:
+            value = layer.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+        if self.default is None:
+            raise KeyError(key)
+        return self.default()
+
+    def get(self, key, default=None):
+        for layer in self._layers:
+            value = layer.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+        return default
+
+    def __contains__(self, key) -> bool:
+        return any(key in layer for layer in self._layers)
+
+    def __iter__(self) -> Iterator:
+        # Same order as {**a, **b}: keys of the oldest layer first
+        seen: set = set()
+        for layer in reversed(self._layers):
+            for key in layer:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self) -> int:
+        """Number of distinct keys, O(total size) like an eager merge."""
+        if len(self._layers) == 1:
+            return len(self._layers[0])
+        return len(set().union(*self._layers))
+
+    def __repr__(self) -> str:
+        maps = ", ".join(map(repr, self.maps))
+        return f"{type(self).__name__}({maps})"
+
+    def add(self, mapping: Mapping) -> None:
+        """Add a newest layer, compacting the oldest past max_depth."""
+        self._layers.insert(0, mapping)
+        if len(self._layers) > self.max_depth:
+            self.compact(self.max_depth // 2 or 1)
+
+    def compact(self, depth: int = 1) -> None:
+        """Merge the oldest layers into one dict, leaving depth layers.
+
+        The merged layer is a copy: later changes to those inputs no longer
+        show through the view.
+        """
+        if depth <= 0:
+            raise ValueError("depth must be positive")
+        if len(self._layers) <= depth:
+            return
+        keep = self._layers[: depth - 1]
+        merged: dict = {}
+        for layer in reversed(self._layers[depth - 1 :]):
+            merged.update(layer)
+        self._layers = keep + [merged]
+
+    def to_dict(self) -> dict:
+        """Return an eager merge, equal to {**map1, **map2, ...}."""
+        merged: dict = {}
+        for layer in reversed(self._layers):
+            merged.update(layer)
+        return merged
@@ -0,0 +1,107 @@
+"""CPU-heavy pipeline stages: map() vs parallel_map()
+
+- uuid: parse Measurement-style UUID strings, pure Python (holds the GIL)
+- zlib: compress 64 KiB blocks (releases the GIL)
+- digits: len(str(F(n))) over generator_fibonacci(), an infinite input;
+  only the first terms are taken, the rest is never read
+
+Each workload runs serially, on a thread pool and on a process pool.
+Speedups depend on the number of cores (os.cpu_count() is printed).
+
+Usage: python parallel_perf.py [items] [workers]
+"""
+
+
+from itertools import islice
+import os
+import random
+import sys
+import time
+import uuid
+import zlib
+
+from parallel_stage import parallel_map
+from quiet_import import import_quietly
+
+generators = import_quietly("_03_yield_and_generators")
+generator_fibonacci = generators.generator_fibonacci
+
+ITEMS = 20_000
+BLOCK_SIZE = 1 << 16
+FIB_TERMS = 20_000
+
+
+def _parse_uuid(text):
+    return uuid.UUID(text).int % 100
+
+
+def _compress(block):
+    return len(zlib.compress(block, 6))
+
+
+def _digits(n):
+    return len(str(n))
+
+
+def _workloads(items):
+    rnd = random.Random(0)
+    uuids = [str(uuid.UUID(int=rnd.getrandbits(128))) for _ in range(items)]
+    # Compressible, but not trivially: repeated random words
+    words = [rnd.randbytes(8) for _ in range(256)]
+    blocks = [
+        b"".join(rnd.choices(words, k=BLOCK_SIZE // 8))
+        for _ in range(max(1, items // 200))
+    ]
+    return {
+        "uuid": (_parse_uuid, lambda: uuids, 256),
+        "zlib": (_compress, lambda: blocks, 1),
+        "digits": (_digits, generator_fibonacci, 64),
+    }
+
+
+def _run(mapper, func, source, limit):
+    start = time.perf_counter()
+    results = list(islice(mapper(func, source()), limit))
+    return results, time.perf_counter() - start
+
+
+def main(items=ITEMS, workers=None):
+    workers = workers or os.cpu_count() or 1
+    print(f"os.cpu_count() = {os.cpu_count()}, {workers} worker(s)")
+    print(f"{'workload':<8} {'mode':<18} {'seconds':>9} {'speedup':>8}")
+    for name, (func, source, chunk_size) in _workloads(items).items():
+        limit = FIB_TERMS if name == "digits" else None
+        expected, serial = _run(map, func, source, limit)
+        print(f"{name:<8} {'map()':<18} {serial:>9.3f} {1:>8.2f}")
+        for mode, options in (
+            ("threads", {}),
+            ("threads, unordered", {"ordered": False}),
+            ("processes", {"processes": True}),
+        ):
+
+            def mapper(func, iterable):
+                return parallel_map(
+                    func,
+                    iterable,
+                    workers=workers,
+                    chunk_size=chunk_size,
+                    **options,
+                )
+
+            results, seconds = _run(mapper, func, source, limit)
+            if options.get("ordered", True):
+                assert results == expected, f"{name} {mode} results differ"
+            elif limit is None:
+                assert sorted(results) == sorted(expected)
+            else:
+                # Unordered, the first results to finish from an infinite
+                # input need not come from the first inputs
+                assert len(results) == limit
+            print(
+                f"{name:<8} {mode:<18} {seconds:>9.3f} "
+                f"{serial / seconds:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
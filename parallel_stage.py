@@ -0,0 +1,146 @@
+"""Parallel map stage for generator pipelines
+
+- The generators in _03_yield_and_generators.py run on one core; a CPU-heavy
+  stage (parsing, UUID handling, expensive predicates) becomes the bottleneck
+- parallel_map() cuts its input into chunks and runs func over each chunk in
+  a thread or process pool
+- At most max_in_flight chunks are submitted and not yet consumed: the input
+  is only read as fast as results are taken, so infinite generators such as
+  generator_fibonacci() are safe
+- Results come back in input order, or as soon as each chunk is done with
+  ordered=False
+- parallel() wraps it as a stage for measurement_pipeline.pipeline()
+- See parallel_perf.py for numbers
+
+Threads only help when func releases the GIL (zlib, hashlib, I/O); use
+processes=True for pure-Python work, in which case func and the items must
+be picklable.
+"""
+
+
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
+import os
+from typing import Callable, Iterable, Iterator
+
+CHUNK_SIZE = 256
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _apply(func: Callable, chunk: list) -> list:
+    return list(map(func, chunk))
+
+
+def parallel_map(
+    func: Callable,
+    iterable: Iterable,
+    *,
+    workers: int | None = None,
+    processes: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    max_in_flight: int | None = None,
+    ordered: bool = True,
+    executor: Executor | None = None,
+) -> Iterator:
+    """Yield func(item) for every item, computed in a worker pool.
+
+    The input is read lazily by the consuming thread. Closing the generator
+    (or breaking out of a for loop over it) cancels the queued chunks.
+
+    :param func: Called once per item.
+    :param iterable: May be infinite.
+    :param workers: Pool size, defaults to os.cpu_count().
+    :param processes: Use a process pool instead of a thread pool.
+    :param chunk_size: Items sent to a worker at a time.
+    :param max_in_flight: Chunks submitted but not yet consumed, defaults to
+        twice the number of workers.
+    :param ordered: Yield in input order; False yields each chunk as soon as
+        it is done.
+    :param executor: Use this pool instead of creating one; it is left
+        running.
+    :raises ValueError: If chunk_size or max_in_flight is not positive.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    workers = workers or os.cpu_count() or 1
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+    if max_in_flight <= 0:
+        raise ValueError("max_in_flight must be positive")
+    # Validated here, so errors surface before the first next()
+    return _parallel_map(
+        func,
+        iterable,
+        workers,
+        processes,
+        chunk_size,
+        max_in_flight,
+        ordered,
+        executor,
+    )
+
+
+def _parallel_map(
+    func,
+    iterable,
+    workers,
+    processes,
+    chunk_size,
+    max_in_flight,
+    ordered,
+    executor,
+):
+    own_executor = executor is None
+    if own_executor:
+        pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        executor = pool(workers)
+
+    pending: deque | set = deque() if ordered else set()
+    try:
+        for chunk in _chunks(iterable, chunk_size):
+            future = executor.submit(_apply, func, chunk)
+            if ordered:
+                pending.append(future)
+                if len(pending) >= max_in_flight:
+                    yield from pending.popleft().result()
+            else:
+                pending.add(future)
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+
+        if ordered:
+            while pending:
+                yield from pending.popleft().result()
+        else:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def parallel(func: Callable, **options) -> Callable[[Iterable], Iterator]:
+    """Stage that maps func over the rows with parallel_map(**options)."""
+
+    def stage(rows):
+        return parallel_map(func, rows, **options)
+
+    return stage
@@ -0,0 +1,85 @@
+"""Shuffled access order without shuffling the data
+
+- dict_perf._shuffle_data_points copies every item into a list, shuffles it
+  and builds a new dict; list_perf shuffles in place and loses the original
+  order
+- PermutedView keeps the dataset once, plus a permutation of its positions
+  in a compact typed array (4 bytes per record below 2**32 records)
+- Iteration, random access and reshuffling never copy or move the records
+- Mappings such as dict_perf's dataset are viewed through their values; the
+  view keeps a list of the keys (one reference per record), not the records
+"""
+
+
+from array import array
+from collections.abc import Mapping, Sequence
+import random
+from typing import Callable, Iterator
+
+
+def _position_typecode(count: int) -> str:
+    return "I" if count < 2**32 and array("I").itemsize == 4 else "q"
+
+
+class PermutedView(Sequence):
+    """A read-only, shuffled view of a sequence, mapping or DataPoint store.
+
+    :param data: A sequence (e.g. list); a mapping, whose values are viewed
+        (keys added or removed later are not seen); or anything with a
+        row(position) method and a length, such as DataPointStore and
+        DataPointFile.
+    :param seed: Seed for the first shuffle; None for OS randomness.
+    :raises TypeError: If data is none of the above.
+    """
+
+    __slots__ = ("_data", "_get", "_permutation", "_rng")
+
+    def __init__(self, data, seed=None) -> None:
+        self._data = data
+        self._get: Callable
+        if isinstance(data, Sequence):
+            self._get = data.__getitem__
+        elif isinstance(data, Mapping):
+            keys = list(data)
+            self._get = lambda position: data[keys[position]]
+        elif hasattr(data, "row") and hasattr(data, "__len__"):
+            self._get = data.row
+        else:
+            raise TypeError(
+                f"Cannot view {type(data).__name__}: expected a sequence, a "
+                "mapping, or an object with row() and len()"
+            )
+        self._permutation = array(
+            _position_typecode(len(data)), range(len(data))
+        )
+        self._rng = random.Random(seed)
+        self.reshuffle()
+
+    def reshuffle(self, seed=None) -> None:
+        """Shuffle the access order again, in place.
+
+        :param seed: Reseed before shuffling, for a reproducible order.
+        """
+        if seed is not None:
+            self._rng.seed(seed)
+        self._rng.shuffle(self._permutation)
+
+    @property
+    def permutation(self) -> array:
+        """The data position behind each view position. Do not modify it."""
+        return self._permutation
+
+    @property
+    def data(self):
+        return self._data
+
+    def __len__(self) -> int:
+        return len(self._permutation)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(map(self._get, self._permutation[index]))
+        return self._get(self._permutation[index])
+
+    def __iter__(self) -> Iterator:
+        return map(self._get, self._permutation)
@@ -0,0 +1,127 @@
+"""Measurement feeds: in-memory lists vs the streaming pipeline
+
+Writes a CSV and a JSON Lines feed of random Measurements, then computes
+the same results as the Measurement section of _03_yield_and_generators.py
+(count, distinct values and per-id map of value >= 70):
+- lists: load every row into a list, then one comprehension per result
+- stream: measurement_pipeline, one pass, one row at a time
+
+Reports rows/sec, and the peak memory tracemalloc sees in a separate run.
+
+Usage: python pipeline_perf.py [rows]
+"""
+
+
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+from measurement_pipeline import (
+    ById,
+    CHUNK_SIZE,
+    Count,
+    Distinct,
+    Measurement,
+    Throughput,
+    aggregate,
+    pipeline,
+    read_measurements,
+    where,
+)
+
+ROWS = 500_000
+THRESHOLD = 70
+
+
+def _random_measurements(rows, seed=0):
+    rnd = random.Random(seed)
+    for _ in range(rows):
+        yield Measurement(
+            str(uuid.UUID(int=rnd.getrandbits(128), version=4)),
+            rnd.randint(1, 1000),
+            rnd.randint(1, 1000),
+            rnd.randint(0, 100),
+        )
+
+
+def _write_feeds(directory, rows):
+    csv_path = os.path.join(directory, "feed.csv")
+    jsonl_path = os.path.join(directory, "feed.jsonl")
+    with open(csv_path, "w", newline="") as csv_file, open(
+        jsonl_path, "w"
+    ) as jsonl_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(Measurement._fields)
+        for m in _random_measurements(rows):
+            writer.writerow(m)
+            jsonl_file.write(json.dumps(m._asdict()) + "\n")
+    return csv_path, jsonl_path
+
+
+def _lists(path):
+    measurements = list(read_measurements(path))
+    high = [m for m in measurements if m.value >= THRESHOLD]
+    results = {
+        "count": sum(1 for _ in high),
+        "values": {m.value for m in high},
+        "by_id": {m.id: m.value for m in high},
+    }
+    return results, len(measurements)
+
+
+def _stream(path):
+    throughput = Throughput()
+    rows = pipeline(
+        read_measurements(path, CHUNK_SIZE),
+        throughput,
+        where(lambda m: m.value >= THRESHOLD),
+    )
+    results = aggregate(
+        rows, count=Count(), values=Distinct("value"), by_id=ById("value")
+    )
+    return results, throughput.rows
+
+
+def _traced_peak(func, path):
+    tracemalloc.start()
+    func(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main(rows=ROWS):
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_feeds(directory, rows)
+        print(f"{rows:,} rows, value >= {THRESHOLD}")
+        print(
+            f"{'feed':<8} {'approach':<8} {'MB':>8} {'rows/sec':>12} "
+            f"{'peak traced MB':>16}"
+        )
+        for path in paths:
+            feed = os.path.splitext(path)[1][1:]
+            size = os.path.getsize(path) / 1e6
+            expected = None
+            for name, func in (("lists", _lists), ("stream", _stream)):
+                start = time.perf_counter()
+                results, processed = func(path)
+                rate = processed / (time.perf_counter() - start)
+                if expected is None:
+                    expected = results
+                assert results == expected, f"{name} results differ"
+                # The per-id map is part of the result, not of the pipeline
+                peak = _traced_peak(func, path) / 1e6
+                print(
+                    f"{feed:<8} {name:<8} {size:>8.1f} "
+                    f"{rate:>12,.0f} {peak:>16.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
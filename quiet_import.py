@@ -0,0 +1,18 @@
+"""Import the tutorial modules from the *_perf.py scripts
+
+The tutorial modules (_02_dictionaries.py, _03_yield_and_generators.py, ...)
+run and print their examples at import. import_quietly() imports them with
+that output discarded.
+"""
+
+
+import contextlib
+import importlib
+import io
+from types import ModuleType
+
+
+def import_quietly(name: str) -> ModuleType:
+    """Import a module, discarding what it prints while being imported."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return importlib.import_module(name)
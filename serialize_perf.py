@@ -0,0 +1,85 @@
+"""Serializing namedtuples: json.dumps(r._asdict()) vs record_writer
+
+Records are DataPoints (ints and a float) and Measurements (a UUID string
+and ints, as in _03_yield_and_generators.py), written to an in-memory
+text buffer:
+- json.dumps(r._asdict()), one line per record
+- RecordWriter, JSON Lines from a compiled encoder
+- RecordWriter, CSV
+
+Usage: python serialize_perf.py [count]
+"""
+
+
+import io
+import json
+import random
+import sys
+import time
+import uuid
+
+from datapoint_gen import make_data_points
+from measurement_pipeline import Measurement
+from record_writer import RecordWriter
+
+COUNT = 200_000
+
+
+def _measurements(count, seed=0):
+    rnd = random.Random(seed)
+    return [
+        Measurement(
+            str(uuid.UUID(int=rnd.getrandbits(128), version=4)),
+            rnd.randint(1, 3),
+            rnd.randint(1, 3),
+            rnd.randint(0, 100),
+        )
+        for _ in range(count)
+    ]
+
+
+def _asdict_dumps(records, file, record_type):
+    for record in records:
+        file.write(json.dumps(record._asdict()) + "\n")
+
+
+def _jsonl(records, file, record_type):
+    RecordWriter(file, record_type).write_many(records)
+
+
+def _csv(records, file, record_type):
+    RecordWriter(file, record_type, format="csv").write_many(records)
+
+
+def _records_per_second(func, records, record_type):
+    file = io.StringIO()
+    start = time.perf_counter()
+    func(records, file, record_type)
+    return len(records) / (time.perf_counter() - start), file.getvalue()
+
+
+def main(count=COUNT):
+    data_points = make_data_points(count)
+    datasets = {
+        "DataPoint": (data_points, type(data_points[0])),
+        "Measurement": (_measurements(count), Measurement),
+    }
+    print(f"records/sec, {count:,} records")
+    print(f"{'record':<12} {'_asdict+dumps':>14} {'jsonl':>12} {'csv':>12}")
+    for name, (records, record_type) in datasets.items():
+        expected, text = _records_per_second(
+            _asdict_dumps, records, record_type
+        )
+        rates = [expected]
+        baseline = [json.loads(line) for line in text.splitlines()]
+        for func in (_jsonl, _csv):
+            rate, text = _records_per_second(func, records, record_type)
+            if func is _jsonl:
+                parsed = [json.loads(line) for line in text.splitlines()]
+                assert parsed == baseline, f"{name} JSON Lines differ"
+            rates.append(rate)
+        print(f"{name:<12} " + " ".join(f"{r:>12,.0f}" for r in rates))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,76 @@
+"""Randomized access order: materialized shuffles vs PermutedView
+
+Time and peak traced memory to get a shuffled order over 500k records,
+then the time to iterate it once. Iterating a view pays for one extra
+indirection per record (and a row view for stores).
+"""
+
+
+import random
+import time
+import tracemalloc
+
+from datapoint_gen import make_data_points, make_store
+from permuted_view import PermutedView
+
+COUNT = 500_000
+
+
+def _dict_shuffle(data_points):
+    # dict_perf._shuffle_data_points
+    temp = list(data_points.items())
+    random.shuffle(temp)
+    return dict(temp).values()
+
+
+def _list_copy_shuffle(data_points):
+    # list_perf shuffles in place; copy first to keep the original order
+    shuffled = data_points.copy()
+    random.shuffle(shuffled)
+    return shuffled
+
+
+def _measure(shuffle, data_points):
+    # Trace a separate run, tracemalloc slows down the timed one
+    tracemalloc.start()
+    shuffle(data_points)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    shuffled = shuffle(data_points)
+    shuffle_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in shuffled:
+        pass
+    iterate_s = time.perf_counter() - start
+    return shuffle_s, peak, iterate_s
+
+
+def main():
+    random.seed(0)
+    data_list = make_data_points(COUNT)
+    data_dict = {p.id: p for p in data_list}
+    store = make_store(COUNT)
+
+    print(f"{COUNT:,} records")
+    print(
+        f"{'method':<22} {'shuffle s':>10} {'peak MiB':>9} {'iterate s':>10}"
+    )
+    for name, shuffle, data_points in (
+        ("dict_perf shuffle", _dict_shuffle, data_dict),
+        ("list copy + shuffle", _list_copy_shuffle, data_list),
+        ("PermutedView(dict)", PermutedView, data_dict),
+        ("PermutedView(list)", PermutedView, data_list),
+        ("PermutedView(store)", PermutedView, store),
+    ):
+        shuffle_s, peak, iterate_s = _measure(shuffle, data_points)
+        print(
+            f"{name:<22} {shuffle_s:>10.3f} {peak / 2**20:>9.1f} "
+            f"{iterate_s:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,36 @@
+"""Memory layout comparison matrix
+
+Builds count records of three ints in each layout and reports, per layout:
+- bytes per record (traced memory / count)
+- total and peak traced memory (tracemalloc) while building them
+- RSS growth and peak RSS growth while building them
+- for one-object-per-record layouts: construction, attribute read, attribute
+  write and iteration rates, with their variance (see measure_speed)
+
+Memory is measured by memprofile.py, each layout in a fresh interpreter.
+
+Usage: python slots_perf.py [count ...] [--sample N] [--in-process]
+       (default: 1M records)
+"""
+
+
+from array import array
+import argparse
+import collections
 from dataclasses import dataclass
-import tracemalloc
+import statistics
+import struct
+import timeit
+from typing import Callable, NamedTuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-# TODO: Cleanup
+import memprofile
+
+COUNTS = (1_000_000,)
 
 
 class NoSlots:
@@ -44,108 +73,222 @@ class DataClass:
     c: int
 
 
-# We need to do something with our objects or else they will be gc'd
-# at the end of the loop
-keep = []
+# Python 3.10+
+@dataclass(slots=True)
+class SlotsDataClass:
+    a: int
+    b: int
+    c: int
+
+
+NamedTupleABC = collections.namedtuple("NamedTupleABC", "a b c")
 
-# Make 1M objects
-count = 1_000_000
 
-# Start the trace of 'no slots'
-tracemalloc.start()
+class TypedNamedTuple(NamedTuple):
+    a: int
+    b: int
+    c: int
 
-for n in range(count):
-    no_slots = NoSlots(1 + n, 2 + n, 3 + n)
-    keep.append(no_slots)
 
-# End the trace of 'no slots'
-snapshot_no_slots = tracemalloc.take_snapshot()
-tracemalloc.stop()
+# Array of structs: one packed 24-byte record per object
+ABC_STRUCT = struct.Struct("<qqq")
 
-# Clear the keep for the next trace
-keep.clear()
 
-# Start the trace of 'using slots'
-tracemalloc.start()
+# ---------- Layout builders ----------
+# Each builder makes count records (1 + n, 2 + n, 3 + n) and returns
+# whatever keeps them alive
 
-for n in range(count):
-    slots = Slots(1 + n, 2 + n, 3 + n)
-    keep.append(slots)  # type: ignore
 
-# End the trace of 'using slots'
-snapshot_using_slots = tracemalloc.take_snapshot()
-tracemalloc.stop()
+def _build_objects(cls):
+    def build(count):
+        return [cls(1 + n, 2 + n, 3 + n) for n in range(count)]
 
-# Clear the keep for the next trace
-keep.clear()
+    return build
 
-# Start the trace of 'tuples'
-tracemalloc.start()
 
-for n in range(count):
-    tup = (
-        1 + n,
-        2 + n,
-        3 + n,
+def _build_tuples(count):
+    return [(1 + n, 2 + n, 3 + n) for n in range(count)]
+
+
+def _build_struct(count):
+    records = bytearray(ABC_STRUCT.size * count)
+    pack_into = ABC_STRUCT.pack_into
+    for n in range(count):
+        pack_into(records, n * ABC_STRUCT.size, 1 + n, 2 + n, 3 + n)
+    return records
+
+
+def _build_columns(count):
+    return (
+        array("q", range(1, count + 1)),
+        array("q", range(2, count + 2)),
+        array("q", range(3, count + 3)),
+    )
+
+
+def _build_numpy(count):
+    records = np.empty(count, dtype=[("a", "<i8"), ("b", "<i8"), ("c", "<i8")])
+    records["a"] = np.arange(1, count + 1)
+    records["b"] = np.arange(2, count + 2)
+    records["c"] = np.arange(3, count + 3)
+    return records
+
+
+LAYOUTS: dict[str, Callable[[int], object]] = {
+    "class": _build_objects(NoSlots),
+    "class + __slots__": _build_objects(Slots),
+    "dataclass": _build_objects(DataClass),
+    "dataclass(slots)": _build_objects(SlotsDataClass),
+    "tuple": _build_tuples,
+    "namedtuple": _build_objects(NamedTupleABC),
+    "typing.NamedTuple": _build_objects(TypedNamedTuple),
+    "struct (AoS)": _build_struct,
+    "array columns": _build_columns,
+}
+if np is not None:
+    LAYOUTS["numpy structured"] = _build_numpy
+
+
+# ---------- Speed ----------
+# Layouts made of one object per record, timed for construction, attribute
+# reads/writes and iteration. Tuples are read by index and, like namedtuples,
+# cannot be written.
+TIMED_LAYOUTS: dict[str, type] = {
+    "class": NoSlots,
+    "class + __slots__": Slots,
+    "dataclass": DataClass,
+    "dataclass(slots)": SlotsDataClass,
+    "tuple": tuple,
+    "namedtuple": NamedTupleABC,
+    "typing.NamedTuple": TypedNamedTuple,
+}
+SPEED_OPERATIONS = ("construct", "read", "write", "iterate")
+REPEAT = 5
+
+
+def _read_attributes(records):
+    for r in records:
+        # Attribute loads only, the values are discarded
+        r.a
+        r.b
+        r.c
+
+
+def _read_items(records):
+    for r in records:
+        r[0]
+        r[1]
+        r[2]
+
+
+def _write_attributes(records):
+    for r in records:
+        r.a = 1
+        r.b = 2
+        r.c = 3
+
+
+def _iterate(records):
+    for _ in records:
+        pass
+
+
+def _rates(func, operations: int, repeat: int) -> tuple[float, float]:
+    """Return the mean and standard deviation of operations per second."""
+    # timeit disables the garbage collector while timing
+    times = timeit.repeat(func, number=1, repeat=repeat)
+    rates = [operations / t for t in times]
+    return statistics.mean(rates), statistics.stdev(rates)
+
+
+def measure_speed(cls: type, count: int, repeat: int = REPEAT) -> dict:
+    """Time construction, reads, writes and iteration over count records.
+
+    :return: (mean, stdev) operations per second for each of
+        SPEED_OPERATIONS, or None where the layout does not support it.
+    """
+    build = _build_tuples if cls is tuple else _build_objects(cls)
+    records = build(count)
+    read = _read_items if cls is tuple else _read_attributes
+    return {
+        "construct": _rates(lambda: build(count), count, repeat),
+        "read": _rates(lambda: read(records), 3 * count, repeat),
+        "write": (
+            None
+            if issubclass(cls, tuple)
+            else _rates(lambda: _write_attributes(records), 3 * count, repeat)
+        ),
+        "iterate": _rates(lambda: _iterate(records), count, repeat),
+    }
+
+
+def _format_rate(rate) -> str:
+    if rate is None:
+        return "-"
+    mean, stdev = rate
+    return f"{mean / 1e6:.1f}±{stdev / mean:.0%}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("counts", nargs="*", type=int, default=COUNTS)
+    parser.add_argument(
+        "--sample",
+        type=int,
+        help="trace only this many records per layout and scale up",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="measure memory in this process instead of a fresh one per phase",
     )
-    keep.append(tup)  # type: ignore
-
-# End the trace of 'tuples'
-snapshot_using_tuples = tracemalloc.take_snapshot()
-tracemalloc.stop()
-
-# Clear the keep for the next trace
-keep.clear()
-
-# Start the trace of 'dataclass'
-tracemalloc.start()
-
-for n in range(count):
-    d = DataClass(1 + n, 2 + n, 3 + n)
-    keep.append(d)  # type: ignore
-
-# End the trace of 'dataclass'
-snapshot_dataclass = tracemalloc.take_snapshot()
-tracemalloc.stop()
-
-# Filter out tracemalloc traces
-# fmt: off
-snapshot_no_slots = snapshot_no_slots.filter_traces((
-    tracemalloc.Filter(False, tracemalloc.__file__),
-))
-snapshot_using_slots = snapshot_using_slots.filter_traces((
-    tracemalloc.Filter(False, tracemalloc.__file__),
-))
-# fmt: on
-
-# Compare snapshots and print the differences
-snapshot_diffs = snapshot_using_slots.compare_to(snapshot_no_slots, "filename")
-for diff in snapshot_diffs:
-    print(diff)
-
-# Filter out tracemalloc traces
-# fmt: off
-snapshot_using_tuples = snapshot_using_tuples.filter_traces((
-    tracemalloc.Filter(False, tracemalloc.__file__),
-))
-
-# Compare snapshots and print the differences
-snapshot_diffs = \
-    snapshot_using_slots.compare_to(snapshot_using_tuples, "filename")
-# fmt: on
-for diff in snapshot_diffs:
-    print(diff)
-
-# Filter out tracemalloc traces
-# fmt: off
-snapshot_dataclass = snapshot_dataclass.filter_traces((
-    tracemalloc.Filter(False, tracemalloc.__file__),
-    tracemalloc.Filter(False, "<string>"),
-))
-
-# Compare snapshots and print the differences
-snapshot_diffs = \
-    snapshot_using_slots.compare_to(snapshot_dataclass, "filename")
-# fmt: on
-for diff in snapshot_diffs:
-    print(diff)
+    args = parser.parse_args(argv)
+
+    for count in args.counts:
+        print(f"\n{count:,} records of 3 ints")
+        print("Speed in millions of operations/s, mean±relative stdev")
+        print(
+            f"{'layout':<20} {'bytes/rec':>10} {'traced MiB':>11} "
+            f"{'peak MiB':>9} {'RSS MiB':>8} {'peak RSS':>9} "
+            + " ".join(f"{op:>10}" for op in SPEED_OPERATIONS)
+        )
+        for name, build in LAYOUTS.items():
+            if args.in_process:
+                result = memprofile.measure(build, count, args.sample)
+            else:
+                result = memprofile.measure_isolated(
+                    "slots_perf", name, count, args.sample
+                )
+            if name in TIMED_LAYOUTS:
+                result.update(measure_speed(TIMED_LAYOUTS[name], count))
+
+            print(
+                f"{name:<20} {result['bytes_per_record']:>10.1f} "
+                f"{_mib(result['traced_bytes']):>11} "
+                f"{_mib(result['traced_peak_bytes']):>9} "
+                f"{_mib(result['rss_bytes']):>8} "
+                f"{_mib(result['peak_rss_bytes']):>9} "
+                + " ".join(
+                    f"{_format_rate(result.get(op)):>10}"
+                    for op in SPEED_OPERATIONS
+                )
+            )
+        if args.sample and args.sample < count:
+            print(f"(traced figures scaled up from {args.sample:,} records)")
+        if np is None:
+            print("(numpy not installed, numpy structured skipped)")
+
+
+def _mib(size) -> str:
+    return "-" if size is None else f"{size / 2**20:.1f}"
+
+
+def bench():
+    """Build every layout once at COUNTS[0] records (timed by bench.py)."""
+    for build in LAYOUTS.values():
+        records = build(COUNTS[0])
+        del records
+
+
+if __name__ == "__main__":
+    main()
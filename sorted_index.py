@@ -0,0 +1,137 @@
+"""Sorted secondary indexes over DataPointStore columns
+
+- One index per field: the field's values sorted in a typed array, plus the
+  row position of each value in a parallel array
+- Range queries are two bisects, then only the matching rows are touched
+- Results are produced lazily as positions, ids or row views
+- Appended records are inserted in sorted order when the index is tracked
+- See index_perf.py for build time, memory and query numbers
+"""
+
+
+from array import array
+from bisect import bisect_left, bisect_right
+import time
+from typing import Iterator
+
+from datapoint_store import DataPoint, DataPointRow, DataPointStore
+
+
+class SortedIndex:
+    """A sorted index of one DataPointStore field.
+
+    Bounds are inclusive by default; pass low_inclusive/high_inclusive=False
+    for strict comparisons. A bound of None is unbounded, e.g. quality > 0.95:
+
+        index.ids(0.95, low_inclusive=False)
+    """
+
+    __slots__ = (
+        "store",
+        "field",
+        "_field_position",
+        "_keys",
+        "_positions",
+        "build_seconds",
+    )
+
+    def __init__(self, store: DataPointStore, field: str) -> None:
+        start = time.perf_counter()
+        column = store.column(field)
+        order = sorted(range(len(column)), key=column.__getitem__)
+        self.store = store
+        self.field = field
+        self._field_position = DataPoint._fields.index(field)
+        self._keys = array(column.typecode, map(column.__getitem__, order))
+        self._positions = array("q", order)
+        self.build_seconds = time.perf_counter() - start
+
+    @classmethod
+    def from_store(
+        cls, store: DataPointStore, field: str, track=True
+    ) -> "SortedIndex":
+        """Build an index over a store field.
+
+        :param store: The DataPointStore to index.
+        :param field: A DataPoint field name, e.g. 'temp'.
+        :param track: Keep the index updated as records are appended.
+        :return: A new SortedIndex.
+        """
+        index = cls(store, field)
+        if track:
+            store.track(index)
+        return index
+
+    def add(self, data_point: tuple) -> None:
+        """Insert a newly appended record, keeping the keys sorted."""
+        key = data_point[self._field_position]
+        at = bisect_right(self._keys, key)
+        self._keys.insert(at, key)
+        self._positions.insert(at, len(self._positions))
+
+    def _span(self, low, high, low_inclusive, high_inclusive) -> range:
+        keys = self._keys
+        if low is None:
+            start = 0
+        elif low_inclusive:
+            start = bisect_left(keys, low)
+        else:
+            start = bisect_right(keys, low)
+
+        if high is None:
+            stop = len(keys)
+        elif high_inclusive:
+            stop = bisect_right(keys, high)
+        else:
+            stop = bisect_left(keys, high)
+        return range(start, max(start, stop))
+
+    def positions(
+        self, low=None, high=None, *, low_inclusive=True, high_inclusive=True
+    ) -> Iterator[int]:
+        """Yield the store positions of rows with low <= value <= high,
+        in value order."""
+        span = self._span(low, high, low_inclusive, high_inclusive)
+        return map(self._positions.__getitem__, span)
+
+    def ids(
+        self, low=None, high=None, *, low_inclusive=True, high_inclusive=True
+    ) -> Iterator[int]:
+        """Yield the ids of rows with low <= value <= high."""
+        ids = self.store.column("id")
+        return map(
+            ids.__getitem__,
+            self.positions(
+                low,
+                high,
+                low_inclusive=low_inclusive,
+                high_inclusive=high_inclusive,
+            ),
+        )
+
+    def rows(
+        self, low=None, high=None, *, low_inclusive=True, high_inclusive=True
+    ) -> Iterator[DataPointRow]:
+        """Yield row views of rows with low <= value <= high."""
+        return map(
+            self.store.row,
+            self.positions(
+                low,
+                high,
+                low_inclusive=low_inclusive,
+                high_inclusive=high_inclusive,
+            ),
+        )
+
+    def count(
+        self, low=None, high=None, *, low_inclusive=True, high_inclusive=True
+    ) -> int:
+        return len(self._span(low, high, low_inclusive, high_inclusive))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the sorted keys and positions."""
+        return sum(a.itemsize * len(a) for a in (self._keys, self._positions))
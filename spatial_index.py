@@ -0,0 +1,200 @@
+"""Uniform grid index over DataPoint x/y coordinates
+
+- The plane is cut into square cells of cell_size x cell_size
+- Each cell keeps the ids and coordinates of its points in typed arrays
+- Box and radius queries only visit the cells they overlap; cells that lie
+  completely inside the query are taken whole without per-point checks
+- k-nearest queries search outward ring by ring and stop as soon as no
+  unvisited cell can hold a closer point
+- See spatial_perf.py for numbers against a linear scan
+"""
+
+
+from array import array
+import heapq
+from math import inf, sqrt
+from typing import Iterable
+
+# DataPoint x/y are 0..1000, ~10 points per cell at 500k points
+DEFAULT_CELL_SIZE = 16
+
+
+class GridIndex:
+    """Spatial index of (id, x, y) points on integer coordinates."""
+
+    __slots__ = ("cell_size", "_cells", "_bounds", "_count")
+
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        # (cx, cy) -> (ids, xs, ys)
+        self._cells: dict[tuple[int, int], tuple[array, array, array]] = {}
+        # Occupied cell range: cx_min, cy_min, cx_max, cy_max
+        self._bounds = (inf, inf, -inf, -inf)
+        self._count = 0
+
+    @classmethod
+    def from_columns(
+        cls, ids: Iterable, xs: Iterable, ys: Iterable, cell_size=None
+    ) -> "GridIndex":
+        index = cls(cell_size or DEFAULT_CELL_SIZE)
+        for d_id, x, y in zip(ids, xs, ys):
+            index.insert(d_id, x, y)
+        return index
+
+    @classmethod
+    def from_store(cls, store, cell_size=None, track=True) -> "GridIndex":
+        """Build an index over a DataPointStore.
+
+        :param store: The DataPointStore to index.
+        :param cell_size: Cell edge length, defaults to DEFAULT_CELL_SIZE.
+        :param track: Keep the index updated as records are appended.
+        :return: A new GridIndex.
+        """
+        index = cls.from_columns(
+            store.column("id"), store.column("x"), store.column("y"), cell_size
+        )
+        if track:
+            store.track(index)
+        return index
+
+    def insert(self, d_id: int, x: int, y: int) -> None:
+        key = (x // self.cell_size, y // self.cell_size)
+        cell = self._cells.get(key)
+        if cell is None:
+            cell = self._cells[key] = (array("q"), array("i"), array("i"))
+            cx_min, cy_min, cx_max, cy_max = self._bounds
+            self._bounds = (
+                min(cx_min, key[0]),
+                min(cy_min, key[1]),
+                max(cx_max, key[0]),
+                max(cy_max, key[1]),
+            )
+        ids, xs, ys = cell
+        ids.append(d_id)
+        xs.append(x)
+        ys.append(y)
+        self._count += 1
+
+    def add(self, data_point: tuple) -> None:
+        """Insert a DataPoint or any (id, x, y, ...) tuple."""
+        self.insert(data_point[0], data_point[1], data_point[2])
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _cell_range(self, x_min, y_min, x_max, y_max):
+        size = self.cell_size
+        if not self._cells:
+            return range(0), range(0)
+        cx_min, cy_min, cx_max, cy_max = self._bounds
+        return (
+            range(max(x_min // size, cx_min), min(x_max // size, cx_max) + 1),
+            range(max(y_min // size, cy_min), min(y_max // size, cy_max) + 1),
+        )
+
+    def in_box(self, x_min, y_min, x_max, y_max) -> list[int]:
+        """Return the ids of points with x_min <= x <= x_max and
+        y_min <= y <= y_max."""
+        size = self.cell_size
+        cells = self._cells
+        found: list[int] = []
+        cx_range, cy_range = self._cell_range(x_min, y_min, x_max, y_max)
+        for cx in cx_range:
+            x_inside = x_min <= cx * size and (cx + 1) * size - 1 <= x_max
+            for cy in cy_range:
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    continue
+                ids, xs, ys = cell
+                if (
+                    x_inside
+                    and y_min <= cy * size
+                    and (cy + 1) * size - 1 <= y_max
+                ):
+                    found.extend(ids)
+                    continue
+                found.extend(
+                    d_id
+                    for d_id, x, y in zip(ids, xs, ys)
+                    if x_min <= x <= x_max and y_min <= y <= y_max
+                )
+        return found
+
+    def in_radius(self, x, y, radius) -> list[int]:
+        """Return the ids of points within radius of (x, y), inclusive."""
+        size = self.cell_size
+        cells = self._cells
+        r2 = radius * radius
+        found: list[int] = []
+        cx_range, cy_range = self._cell_range(
+            x - radius, y - radius, x + radius, y + radius
+        )
+        for cx in cx_range:
+            # Farthest x distance from the query to this cell
+            far_dx = max(abs(x - cx * size), abs((cx + 1) * size - 1 - x))
+            for cy in cy_range:
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    continue
+                ids, xs, ys = cell
+                far_dy = max(abs(y - cy * size), abs((cy + 1) * size - 1 - y))
+                if far_dx * far_dx + far_dy * far_dy <= r2:
+                    found.extend(ids)
+                    continue
+                found.extend(
+                    d_id
+                    for d_id, px, py in zip(ids, xs, ys)
+                    if (px - x) * (px - x) + (py - y) * (py - y) <= r2
+                )
+        return found
+
+    def _ring(self, cx, cy, r):
+        if r == 0:
+            yield cx, cy
+            return
+        for dx in range(-r, r + 1):
+            yield cx + dx, cy - r
+            yield cx + dx, cy + r
+        for dy in range(-r + 1, r):
+            yield cx - r, cy + dy
+            yield cx + r, cy + dy
+
+    def nearest(self, x, y, k: int = 1) -> list[tuple[float, int]]:
+        """Return up to k (distance, id) pairs closest to (x, y), nearest
+        first."""
+        if k <= 0 or not self._count:
+            return []
+
+        size = self.cell_size
+        cells = self._cells
+        cx, cy = x // size, y // size
+        cx_min, cy_min, cx_max, cy_max = self._bounds
+        max_ring = max(cx - cx_min, cx_max - cx, cy - cy_min, cy_max - cy)
+
+        # Max-heap of the best k candidates as (-distance², -id)
+        best: list[tuple[float, int]] = []
+        for r in range(max_ring + 1):
+            for key in self._ring(cx, cy, r):
+                cell = cells.get(key)
+                if cell is None:
+                    continue
+                for d_id, px, py in zip(*cell):
+                    d2 = (px - x) * (px - x) + (py - y) * (py - y)
+                    if len(best) < k:
+                        heapq.heappush(best, (-d2, -d_id))
+                    elif -d2 > best[0][0]:
+                        heapq.heapreplace(best, (-d2, -d_id))
+
+            # Every unvisited cell is at least this far from (x, y)
+            edge = min(
+                x - (cx - r) * size,
+                (cx + r + 1) * size - x,
+                y - (cy - r) * size,
+                (cy + r + 1) * size - y,
+            )
+            if len(best) == k and -best[0][0] <= edge * edge:
+                break
+
+        return sorted((sqrt(-d2), -neg_id) for d2, neg_id in best)
@@ -0,0 +1,90 @@
+"""Spatial queries: GridIndex vs a linear scan over the x/y columns
+
+Usage: python spatial_perf.py [count ...]   (default: 500k and 5M points)
+"""
+
+
+import random
+import sys
+import time
+import timeit
+
+from datapoint_gen import make_store
+from spatial_index import GridIndex
+
+COUNTS = (500_000, 5_000_000)
+QUERIES = 50
+
+
+def _scan_box(columns, x_min, y_min, x_max, y_max):
+    return [
+        d_id
+        for d_id, x, y in zip(*columns)
+        if x_min <= x <= x_max and y_min <= y <= y_max
+    ]
+
+
+def _scan_radius(columns, qx, qy, radius):
+    r2 = radius * radius
+    return [
+        d_id
+        for d_id, x, y in zip(*columns)
+        if (x - qx) * (x - qx) + (y - qy) * (y - qy) <= r2
+    ]
+
+
+def _scan_nearest(columns, qx, qy, k):
+    return sorted(
+        ((x - qx) * (x - qx) + (y - qy) * (y - qy), d_id)
+        for d_id, x, y in zip(*columns)
+    )[:k]
+
+
+def _per_query_ms(func, queries, number):
+    def run():
+        for query in queries:
+            func(*query)
+
+    seconds = min(timeit.repeat(run, number=number, repeat=3))
+    return seconds / number / len(queries) * 1e3
+
+
+def _bench_count(count):
+    store = make_store(count)
+    columns = (store.column("id"), store.column("x"), store.column("y"))
+
+    start = time.perf_counter()
+    index = GridIndex.from_store(store)
+    build_s = time.perf_counter() - start
+    print(f"\n{count:,} points, index built in {build_s:.2f} s")
+
+    rng = random.Random(0)
+    points = [
+        (rng.randint(0, 1000), rng.randint(0, 1000)) for _ in range(QUERIES)
+    ]
+    boxes = [(x, y, x + 20, y + 20) for x, y in points]
+    circles = [(x, y, 15) for x, y in points]
+    nearest = [(x, y, 10) for x, y in points]
+
+    print(f"{'query':<8} {'scan ms':>10} {'index ms':>10} {'speedup':>9}")
+    for name, scan, query, args in (
+        ("box", _scan_box, index.in_box, boxes),
+        ("radius", _scan_radius, index.in_radius, circles),
+        ("nearest", _scan_nearest, index.nearest, nearest),
+    ):
+        # A few scans are enough, they take whole seconds
+        scan_ms = _per_query_ms(lambda *a: scan(columns, *a), args[:3], 1)
+        index_ms = _per_query_ms(query, args, 10)
+        print(
+            f"{name:<8} {scan_ms:>10.2f} {index_ms:>10.4f} "
+            f"{scan_ms / index_ms:>8.0f}x"
+        )
+
+
+def main(counts=COUNTS):
+    for count in counts:
+        _bench_count(count)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or COUNTS)
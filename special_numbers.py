@@ -0,0 +1,92 @@
+"""find_special_numbers() for large limits and sparse selectors
+
+- _04_pythonic_functions.find_special_numbers calls special_selector(n) and
+  len(found) once per candidate: the first million matches of a sparse
+  selector cost many millions of Python-level calls
+- Plain per-item selectors (is_odd, lambdas) are run by filter() and
+  islice(), so only the selector itself is called per candidate
+- A BlockSelector takes a whole range of candidates and returns either the
+  matching subset or a mask, one call per block
+- Block sizes adapt to the hit rate seen so far, so the last block overshoots
+  the limit by little, whether matches are dense or sparse
+- Every path returns exactly what the original returns
+- See special_perf.py for numbers
+"""
+
+
+from itertools import compress, count, islice
+import math
+from typing import Callable, Iterable
+
+MIN_BLOCK = 64
+MAX_BLOCK = 1 << 20
+# Scan a little more than the hit rate predicts, so that most searches end
+# with one more block instead of two
+_OVERSHOOT = 1.1
+
+
+class BlockSelector:
+    """A selector that is called with a block of candidates at once.
+
+    func(block) receives a range and returns the matching numbers in
+    ascending order (any iterable, e.g. a range or a list), or, with
+    mask=True, one truthy/falsy value per number in the block:
+
+        odd = BlockSelector(lambda b: range(b.start | 1, b.stop, 2))
+        odd = BlockSelector(
+            lambda block: [n % 2 == 1 for n in block], mask=True
+        )
+
+    A BlockSelector is still a per-item selector: odd(3) is True.
+    """
+
+    __slots__ = ("func", "mask")
+
+    def __init__(
+        self, func: Callable[[range], Iterable], mask: bool = False
+    ) -> None:
+        self.func = func
+        self.mask = mask
+
+    def select(self, block: range) -> Iterable[int]:
+        """Return the matching numbers of block, in ascending order."""
+        result = self.func(block)
+        return compress(block, result) if self.mask else result
+
+    def __call__(self, n: int) -> bool:
+        return any(True for _ in self.select(range(n, n + 1)))
+
+
+def _next_block_size(scanned: int, found: int, remaining: int) -> int:
+    if not found:
+        # No hit rate yet: keep doubling
+        size = 2 * scanned
+    else:
+        size = math.ceil(remaining * scanned / found * _OVERSHOOT)
+    return max(MIN_BLOCK, min(MAX_BLOCK, size))
+
+
+def find_special_numbers(
+    special_selector: Callable, limit: int = 10, block_size: int = MIN_BLOCK
+) -> list[int]:
+    """Return the first limit numbers n >= 0 for which the selector holds.
+
+    :param special_selector: A per-item callable, or a BlockSelector.
+    :param limit: Number of matches to return.
+    :param block_size: Size of the first block, for a BlockSelector.
+    """
+    if limit <= 0:
+        return []
+    if not isinstance(special_selector, BlockSelector):
+        return list(islice(filter(special_selector, count()), limit))
+
+    found: list[int] = []
+    start = 0
+    size = max(1, block_size)
+    while True:
+        found.extend(special_selector.select(range(start, start + size)))
+        start += size
+        if len(found) >= limit:
+            del found[limit:]
+            return found
+        size = _next_block_size(start, len(found), limit - len(found))
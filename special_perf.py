@@ -0,0 +1,75 @@
+"""find_special_numbers: _04_pythonic_functions vs special_numbers
+
+For a dense selector (is_odd) and a sparse one (multiples of 997), time the
+first `limit` matches with:
+- the original per-item loop
+- special_numbers with the same per-item selector
+- a BlockSelector returning a mask (one list comprehension per block)
+- a BlockSelector returning the subset (a range per block)
+
+Usage: python special_perf.py [limit]
+"""
+
+
+import sys
+import time
+
+from quiet_import import import_quietly
+from special_numbers import BlockSelector, find_special_numbers
+
+tutorial = import_quietly("_04_pythonic_functions")
+
+LIMIT = 100_000
+STEP = 997
+
+
+def _is_multiple(n):
+    return n % STEP == 0
+
+
+def _first_multiple(start):
+    return -(-start // STEP) * STEP
+
+
+SELECTORS = {
+    "is_odd": (
+        tutorial.is_odd,
+        BlockSelector(lambda block: [n % 2 == 1 for n in block], mask=True),
+        BlockSelector(lambda block: range(block.start | 1, block.stop, 2)),
+    ),
+    f"n % {STEP} == 0": (
+        _is_multiple,
+        BlockSelector(lambda block: [n % STEP == 0 for n in block], mask=True),
+        BlockSelector(
+            lambda block: range(_first_multiple(block.start), block.stop, STEP)
+        ),
+    ),
+}
+
+
+def _seconds(find, selector, limit):
+    start = time.perf_counter()
+    found = find(selector, limit)
+    return found, time.perf_counter() - start
+
+
+def main(limit=LIMIT):
+    print(f"First {limit:,} matches, seconds")
+    print(
+        f"{'selector':<14} {'original':>10} {'per item':>10} "
+        f"{'mask':>10} {'subset':>10}"
+    )
+    for name, (per_item, mask, subset) in SELECTORS.items():
+        expected, original = _seconds(
+            tutorial.find_special_numbers, per_item, limit
+        )
+        timings = [original]
+        for selector in (per_item, mask, subset):
+            found, seconds = _seconds(find_special_numbers, selector, limit)
+            assert found == expected, f"{name} results differ"
+            timings.append(seconds)
+        print(f"{name:<14} " + " ".join(f"{t:>10.3f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
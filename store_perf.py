@@ -0,0 +1,86 @@
+"""Memory and lookup latency: dict vs list vs DataPointStore
+
+Every layout holds the same 500k records. Memory is what tracemalloc sees
+while the layout is built; lookup latency is the time to locate 100 random
+ids, the same work as _locate_interesting_ids in list_perf.py/dict_perf.py.
+"""
+
+
+import random
+import timeit
+import tracemalloc
+
+from datapoint_gen import make_columns
+from datapoint_store import DataPoint, DataPointStore
+
+COUNT = 500_000
+LOOKUPS = 100
+
+
+def _build_dict(columns):
+    return {values[0]: DataPoint(*values) for values in zip(*columns)}
+
+
+def _build_list(columns):
+    return [DataPoint(*values) for values in zip(*columns)]
+
+
+def _build_store(columns):
+    return DataPointStore.from_columns(*columns)
+
+
+def _lookup_dict(data_points, ids):
+    return [data_points[d_id] for d_id in ids]
+
+
+def _lookup_list(data_points, ids):
+    found = []
+    for d_id in ids:
+        for data_point in data_points:
+            if d_id == data_point.id:
+                found.append(data_point)
+                break
+    return found
+
+
+def _lookup_store(data_points, ids):
+    return [data_points[d_id] for d_id in ids]
+
+
+def _traced_build(build):
+    # Read from typed columns inside the trace so boxed field values are
+    # counted, just as they are when _make_data_points builds namedtuples
+    columns = make_columns(COUNT)
+    tracemalloc.start()
+    layout = build(columns)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return layout, size
+
+
+def main():
+    ids = random.sample(range(COUNT), LOOKUPS)
+
+    scenarios = [
+        ("dict", _build_dict, _lookup_dict, 100),
+        ("list", _build_list, _lookup_list, 1),
+        ("store", _build_store, _lookup_store, 100),
+    ]
+
+    print(f"{COUNT:,} records, {LOOKUPS} lookups per run")
+    print(f"{'layout':<8} {'MiB':>8} {'bytes/rec':>10} {'µs/lookup':>12}")
+    for name, build, lookup, number in scenarios:
+        layout, size = _traced_build(build)
+        seconds = min(
+            timeit.repeat(lambda: lookup(layout, ids), number=number, repeat=3)
+        )
+        per_lookup = seconds / number / LOOKUPS * 1e6
+        print(
+            f"{name:<8} {size / 2**20:>8.1f} {size / COUNT:>10.1f} "
+            f"{per_lookup:>12.3f}"
+        )
+        del layout
+
+
+if __name__ == "__main__":
+    main()